@@ -754,6 +754,9 @@ private:
                 std::string displayResponse = response; if (displayResponse.length() > 100) displayResponse = displayResponse.substr(0, 100) + "... [trimmed]";
                 std::cout << "[RESPONSE] ";
                 printUtf(displayResponse);
+                // Definitions contain '\n' themselves, so every reply ends with a NUL byte:
+                // the client reads until it and never mistakes an inner newline for the end.
+                response.push_back('\0');
                 int sendLen = static_cast<int>(response.length()); int iSendResult = send(clientSocket, response.c_str(), sendLen, 0);
                 if (iSendResult == SOCKET_ERROR) { std::cerr << "[ERROR] Send failed: " << WSAGetLastError() << std::endl; break; }
                 std::cout << "[OK] Sent " << iSendResult << " bytes" << std::endl; std::cout << "----------------------------------------" << std::endl;
@@ -12,12 +12,112 @@ database_manager.py
 
 import sqlite3
 import logging
-import datetime
-from typing import List, Optional, Tuple
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
 
 # Отримуємо логер
 logger = logging.getLogger("DictionaryClient")
 
+# Розмір кешу підготовлених запитів sqlite3 (LRU за текстом SQL).
+# Стандартний sqlite3 не дає SQLITE_PREPARE_PERSISTENT, тому кеш тримаємо
+# малим: його вистачає на всі _SQL_* константи нижче, а lookaside-пам'ять
+# з'єднання лишається вільною для разових запитів (PRAGMA, CREATE).
+STATEMENT_CACHE_SIZE = 16
+
+# Максимальна кількість записів історії, що зберігаються
+HISTORY_LIMIT = 50
+# Обрізання історії виконується не на кожну вставку, а раз на N вставок
+HISTORY_PRUNE_INTERVAL = 25
+# Нові записи історії накопичуються в пам'яті й пишуться на диск раз на N секунд
+HISTORY_FLUSH_INTERVAL = 1.0
+
+# Поточний час обчислює сама SQLite. Локальний час з мілісекундами - той самий
+# порядок рядків, що й у записів, збережених раніше через datetime.now()
+_SQL_NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')"
+# Той самий формат для часу пошуку, переданого як Unix epoch (див. _next_history_time)
+_SQL_AT_EPOCH = "strftime('%Y-%m-%d %H:%M:%f', ?, 'unixepoch', 'localtime')"
+
+# Схема бази: таблиці та індекси, що створюються одним executescript
+_SQL_SCHEMA = """
+BEGIN;
+
+-- Таблиця історії пошуку
+CREATE TABLE IF NOT EXISTS search_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    word TEXT NOT NULL,
+    translation TEXT,
+    searched_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Унікальність слова потрібна для UPSERT в add_to_history.
+-- Старі бази можуть містити дублікати - лишаємо найновіший запис.
+DELETE FROM search_history
+WHERE id NOT IN (SELECT MAX(id) FROM search_history GROUP BY word);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_hist_word ON search_history(word);
+
+-- Індекс для ORDER BY searched_at DESC (get_history, обрізання історії)
+CREATE INDEX IF NOT EXISTS idx_hist_time ON search_history(searched_at DESC);
+
+-- Таблиця улюблених слів
+CREATE TABLE IF NOT EXISTS favorites (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    word TEXT NOT NULL UNIQUE,
+    translation TEXT,
+    added_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Таблиця налаштувань
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+-- Кеш слова дня: сира відповідь GET_RANDOM на кожну дату
+CREATE TABLE IF NOT EXISTS wotd_cache (
+    date TEXT PRIMARY KEY,
+    payload TEXT,
+    fetched_at INTEGER
+);
+
+COMMIT;
+"""
+
+# Об'єкти схеми, наявність яких означає, що _SQL_SCHEMA вже застосовано
+_SCHEMA_OBJECTS = ('search_history', 'favorites', 'settings', 'wotd_cache', 'idx_hist_word', 'idx_hist_time')
+_SQL_SCHEMA_CHECK = f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({','.join('?' * len(_SCHEMA_OBJECTS))})"
+
+# Тексти запитів - модульні константи: sqlite3 кешує підготовлені запити
+# за точним текстом SQL, тож однаковий рядок гарантує влучання в кеш
+_SQL_ADD_HISTORY = (
+    f"INSERT INTO search_history(word,translation,searched_at) VALUES(?,?,{_SQL_AT_EPOCH}) "
+    "ON CONFLICT(word) DO UPDATE SET translation=excluded.translation,searched_at=excluded.searched_at"
+)
+_SQL_PRUNE_HISTORY = (
+    "DELETE FROM search_history WHERE id NOT IN "
+    f"(SELECT id FROM search_history ORDER BY searched_at DESC, id DESC LIMIT {HISTORY_LIMIT})"
+)
+# id DESC розв'язує нічиї за часом (записи старіших версій з однаковим searched_at)
+_SQL_GET_HISTORY = "SELECT word,translation,searched_at FROM search_history ORDER BY searched_at DESC, id DESC LIMIT ?"
+# word унікальне (idx_hist_word), тому DISTINCT не потрібен
+_SQL_GET_HISTORY_WORDS = "SELECT word FROM search_history ORDER BY searched_at DESC, id DESC LIMIT ?"
+_SQL_CLEAR_HISTORY = "DELETE FROM search_history"
+_SQL_REMOVE_HISTORY = "DELETE FROM search_history WHERE word=?"
+
+_SQL_ADD_FAVORITE = f"INSERT OR IGNORE INTO favorites(word,translation,added_at) VALUES(?,?,{_SQL_NOW})"
+_SQL_GET_FAVORITES = "SELECT word,translation FROM favorites ORDER BY added_at DESC"
+_SQL_REMOVE_FAVORITE = "DELETE FROM favorites WHERE word=?"
+
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key=?"
+_SQL_SET_SETTING = "INSERT OR REPLACE INTO settings(key,value) VALUES(?,?)"
+
+_SQL_GET_WOTD = "SELECT payload FROM wotd_cache WHERE date=?"
+_SQL_SET_WOTD = "INSERT OR REPLACE INTO wotd_cache(date,payload,fetched_at) VALUES(?,?,?)"
+# Слово дня потрібне лише на сьогодні - записи інших дат видаляємо
+_SQL_PRUNE_WOTD = "DELETE FROM wotd_cache WHERE date<>?"
+
 
 class DatabaseManager:
     """
@@ -31,10 +131,10 @@ class DatabaseManager:
         connection (sqlite3.Connection): З'єднання з базою.
 
     Example:
-        >>> db = DatabaseManager('dictionary.db')
-        >>> db.add_to_history('hello', 'привіт')
-        >>> db.get_history()
-        [('hello', 'привіт', '2025-12-11 10:30:00')]
+        >>> with DatabaseManager('dictionary.db') as db:
+        ...     db.add_to_history('hello', 'привіт')
+        ...     db.get_history()
+        [('hello', 'привіт', '2025-12-11 10:30:00.000')]
     """
 
     def __init__(self, db_path: str = 'dictionary_history.db'):
@@ -46,6 +146,24 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.connection: Optional[sqlite3.Connection] = None
+        # Після close() з'єднання більше не відкривається (див. _get_connection)
+        self._closed = False
+        self._lock = threading.RLock()  # Одне з'єднання для запису спільне для UI та фонових потоків
+        # Окреме з'єднання тільки для читання (WAL): SELECT не чекають на запис
+        self._read_connection: Optional[sqlite3.Connection] = None
+        self._read_lock = self._lock
+        self._history_inserts_since_prune = 0
+        # Кеш результатів get_history_words / get_favorites (скидається при змінах)
+        self._hist_cache: Optional[List[str]] = None
+        self._hist_cache_limit = 0
+        self._fav_cache: Optional[List[Tuple[str, str]]] = None
+        # Множина улюблених слів для is_favorite (будується з _fav_cache, скидається разом з ним)
+        self._fav_words: Optional[set] = None
+        # Буфер ще не записаних пошуків (слово, переклад, час) та таймер їх запису
+        self._pending_history: deque = deque(maxlen=HISTORY_LIMIT)
+        # Час останнього пошуку в мілісекундах - кожен наступний строго більший
+        self._last_history_ms = 0
+        self._flush_timer: Optional[threading.Timer] = None
         self._initialize_database()
 
     def _initialize_database(self):
@@ -58,84 +176,218 @@ class DatabaseManager:
         - settings: Налаштування користувача
         """
         try:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            cursor = self.connection.cursor()
-
-            # Таблиця історії пошуку
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS search_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    word TEXT NOT NULL,
-                    translation TEXT,
-                    searched_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Таблиця улюблених слів
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS favorites (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    word TEXT NOT NULL UNIQUE,
-                    translation TEXT,
-                    added_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Таблиця налаштувань
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS settings (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            ''')
+            self.connection = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+                isolation_level='IMMEDIATE'  # Запис бере lock одразу на BEGIN
+            )
+            self._configure_connection(self.connection)
+
+            # Теплий старт: схема вже є - не парсимо CREATE повторно
+            row = self.connection.execute(_SQL_SCHEMA_CHECK, _SCHEMA_OBJECTS).fetchone()
+            if not row or row[0] < len(_SCHEMA_OBJECTS):
+                self.connection.executescript(_SQL_SCHEMA)
 
             self.connection.commit()
+            self._open_read_connection()
             logger.info("База даних ініціалізована успішно")
 
         except sqlite3.Error as e:
-            logger.error(f"Помилка ініціалізації бази даних: {e}")
+            logger.error("Помилка ініціалізації бази даних: %s", e)
             print(f"[БД] ❌ Помилка ініціалізації: {e}")
 
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """
+        Налаштовує PRAGMA для з'єднання.
+
+        WAL дозволяє читати історію/улюблені паралельно із записом,
+        а synchronous=NORMAL зменшує кількість fsync на коміт.
+
+        Args:
+            conn (sqlite3.Connection): З'єднання для налаштування.
+        """
+        if self.db_path == ':memory:':
+            return
+
+        row = conn.execute("PRAGMA journal_mode=WAL").fetchone()
+        if not row or str(row[0]).lower() != 'wal':
+            logger.warning("Не вдалося увімкнути WAL (journal_mode=%s)", row[0] if row else None)
+
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-8000")
+
+    def _open_read_connection(self):
+        """
+        Відкриває з'єднання тільки для читання поруч із основним.
+
+        У WAL режимі читачі не блокуються записом, тому SELECT-методи
+        використовують окреме з'єднання зі своїм lock. Для ':memory:' або при
+        помилці відкриття читання йде через основне з'єднання.
+        """
+        self._read_connection = None
+        self._read_lock = self._lock
+        if self.db_path == ':memory:':
+            return
+
+        try:
+            uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(
+                uri,
+                uri=True,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE
+            )
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-8000")
+            self._read_connection = conn
+            self._read_lock = threading.Lock()
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("З'єднання тільки для читання недоступне: %s", e)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Повертає спільне з'єднання, перепідключаючись якщо його не вдалося відкрити.
+
+        Після явного close() не перепідключається: пізній виклик (наприклад,
+        колбек, що спрацював під час закриття вікна) отримує помилку, а не нове
+        з'єднання, яке вже ніхто не закриє.
+
+        Returns:
+            sqlite3.Connection: Довгоживуче з'єднання з базою.
+
+        Raises:
+            sqlite3.Error: Якщо базу закрито або з'єднання не вдалося відновити.
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("База даних вже закрита")
+        if self.connection is None:
+            self._initialize_database()
+            if self.connection is None:
+                raise sqlite3.OperationalError("Немає з'єднання з базою даних")
+        return self.connection
+
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """
+        Повертає з'єднання для SELECT-запитів.
+
+        Використовувати тільки під self._read_lock.
+
+        Returns:
+            sqlite3.Connection: З'єднання тільки для читання або основне.
+        """
+        if self._read_connection is None:
+            return self._get_connection()
+        return self._read_connection
+
     def add_to_history(self, word: str, translation: str = "") -> bool:
         """
         Додає слово до історії пошуку.
 
+        Запис потрапляє в буфер у пам'яті, а на диск пишеться пакетно
+        через HISTORY_FLUSH_INTERVAL секунд (або при close()).
+
         Args:
             word (str): Слово що було знайдено.
             translation (str): Переклад слова (опціонально).
 
         Returns:
-            bool: True якщо успішно додано, False інакше.
+            bool: True якщо слово прийнято до історії, False після close().
         """
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                timestamp = datetime.datetime.now()
-
-                # 1. Insert or Replace (оновлює timestamp, якщо слово вже є)
-                cursor.execute("""
-                    INSERT OR REPLACE INTO search_history (id, word, translation, searched_at)
-                    VALUES (
-                        (SELECT id FROM search_history WHERE word = ?),
-                        ?, ?, ?
-                    )
-                """, (word, word, translation, timestamp))
-
-                # 2. Keep only last 50 items (Виправлений SQL запит)
-                cursor.execute("""
-                    DELETE FROM search_history 
-                    WHERE id NOT IN (
-                        SELECT id FROM search_history 
-                        ORDER BY searched_at DESC 
-                        LIMIT 50
-                    )
-                """)
-                conn.commit()
-                logger.info(f"Додано до історії: '{word}'")
+        with self._lock:
+            if self._closed:
+                # Буфер після close() вже ніхто не запише
+                logger.debug("База даних закрита, '%s' не додано до історії", word)
+                return False
+            self._pending_history.append((word, translation, self._next_history_time()))
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(HISTORY_FLUSH_INTERVAL, self._flush_history)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        logger.debug("Додано до історії: '%s'", word)
+        return True
+
+    def _next_history_time(self) -> float:
+        """
+        Повертає час пошуку (Unix epoch), строго більший за попередній.
+
+        searched_at зберігається з точністю до мілісекунди, тож пошуки
+        в межах однієї мілісекунди отримали б однаковий час і втратили б
+        порядок. Викликається під self._lock.
+
+        Returns:
+            float: Час у секундах, кратний мілісекунді.
+        """
+        self._last_history_ms = max(int(time.time() * 1000), self._last_history_ms + 1)
+        return self._last_history_ms / 1000
+
+    def _flush_history(self) -> bool:
+        """
+        Записує буфер історії в базу однією транзакцією (UPSERT + обрізання).
+
+        Returns:
+            bool: True якщо буфер порожній або успішно записаний.
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_history:
+                return True
+
+            rows = list(self._pending_history)
+            self._pending_history.clear()
+            try:
+                with self._get_connection() as conn:
+                    self._hist_cache = None
+                    conn.executemany(_SQL_ADD_HISTORY, rows)
+
+                    # Keep only last HISTORY_LIMIT items - ліниво, раз на N вставок
+                    self._history_inserts_since_prune += len(rows)
+                    if self._history_inserts_since_prune >= HISTORY_PRUNE_INTERVAL:
+                        conn.execute(_SQL_PRUNE_HISTORY)
+                        self._history_inserts_since_prune = 0
+                    conn.commit()
+                logger.debug("Історію записано на диск: %s слів", len(rows))
                 return True
+            except sqlite3.Error as e:
+                logger.error("Помилка додавання до історії: %s", e)
+                return False
+
+    def add_to_history_bulk(self, items: Iterable[Tuple[str, str]]) -> int:
+        """
+        Додає кілька слів до історії однією транзакцією (executemany).
+
+        Args:
+            items (Iterable[Tuple[str, str]]): Пари (слово, переклад).
+
+        Returns:
+            int: Кількість оброблених записів, 0 при помилці.
+        """
+        items = list(items)
+        if not items:
+            return 0
+        try:
+            with self._lock:
+                # Спершу буфер - щоб зберегти хронологію записів
+                self._flush_history()
+                # Зростаючий час - останнє слово пакета стає найновішим у історії
+                rows = [(word, translation, self._next_history_time()) for word, translation in items]
+                with self._get_connection() as conn:
+                    self._hist_cache = None
+                    conn.executemany(_SQL_ADD_HISTORY, rows)
+                    conn.execute(_SQL_PRUNE_HISTORY)
+                    self._history_inserts_since_prune = 0
+                    conn.commit()
+                    logger.debug("Додано до історії: %s слів", len(rows))
+                    return len(rows)
         except sqlite3.Error as e:
-            logger.error(f"Помилка додавання до історії: {e}")
-            return False
+            logger.error("Помилка пакетного додавання до історії: %s", e)
+            return 0
 
     def get_history(self, limit: int = 10) -> List[Tuple[str, str, str]]:
         """
@@ -147,18 +399,12 @@ class DatabaseManager:
         Returns:
             List[Tuple[str, str, str]]: Список кортежів (слово, переклад, час).
         """
+        self._flush_history()
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT word, translation, searched_at 
-                    FROM search_history 
-                    ORDER BY searched_at DESC 
-                    LIMIT ?
-                ''', (limit,))
-                return cursor.fetchall()
+            with self._read_lock, self._get_read_connection() as conn:
+                return conn.execute(_SQL_GET_HISTORY, (limit,)).fetchall()
         except sqlite3.Error as e:
-            logger.error(f"Помилка отримання історії: {e}")
+            logger.error("Помилка отримання історії: %s", e)
             return []
 
     def get_history_words(self, limit: int = 10) -> List[str]:
@@ -171,18 +417,45 @@ class DatabaseManager:
         Returns:
             List[str]: Список унікальних слів.
         """
+        with self._lock:
+            # Ще не записані пошуки - найновіші, тому йдуть першими
+            recent = []
+            seen = set()
+            for word, _, _ in reversed(self._pending_history):
+                if word not in seen:
+                    seen.add(word)
+                    recent.append(word)
+            if len(recent) >= limit:
+                return recent[:limit]
+
+            stored = self._get_stored_history_words(limit + len(recent))
+            return (recent + [word for word in stored if word not in seen])[:limit]
+
+    def _get_stored_history_words(self, limit: int) -> List[str]:
+        """
+        Слова історії, вже записані в базу (з кешуванням до наступної зміни).
+
+        Викликати під self._lock.
+
+        Args:
+            limit (int): Максимальна кількість слів.
+
+        Returns:
+            List[str]: Список унікальних слів, найновіші першими.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT DISTINCT word 
-                    FROM search_history 
-                    ORDER BY searched_at DESC 
-                    LIMIT ?
-                ''', (limit,))
-                return [row[0] for row in cursor.fetchall()]
+            # Кеш валідний, якщо вибраний з не меншим limit або містить усю історію
+            cache = self._hist_cache
+            if cache is not None and (self._hist_cache_limit >= limit or len(cache) < self._hist_cache_limit):
+                return cache[:limit]
+
+            with self._read_lock, self._get_read_connection() as conn:
+                # Ітеруємо курсор напряму - без проміжного списку кортежів з fetchall()
+                self._hist_cache = [row[0] for row in conn.execute(_SQL_GET_HISTORY_WORDS, (limit,))]
+                self._hist_cache_limit = limit
+                return list(self._hist_cache)
         except sqlite3.Error as e:
-            logger.error(f"Помилка отримання слів історії: {e}")
+            logger.error("Помилка отримання слів історії: %s", e)
             return []
 
     def clear_history(self) -> bool:
@@ -193,14 +466,15 @@ class DatabaseManager:
             bool: True якщо успішно очищено, False інакше.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM search_history")
+            with self._lock, self._get_connection() as conn:
+                self._pending_history.clear()
+                self._hist_cache = None
+                conn.execute(_SQL_CLEAR_HISTORY)
                 conn.commit()
                 logger.info("Історію пошуку очищено")
                 return True
         except sqlite3.Error as e:
-            logger.error(f"Помилка очищення історії: {e}")
+            logger.error("Помилка очищення історії: %s", e)
             return False
 
     def remove_from_history(self, word: str) -> bool:
@@ -214,16 +488,21 @@ class DatabaseManager:
             bool: True якщо успішно видалено, False інакше.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM search_history WHERE word = ?', (word,))
+            with self._lock, self._get_connection() as conn:
+                pending = [item for item in self._pending_history if item[0] != word]
+                deleted = len(pending) != len(self._pending_history)
+                if deleted:
+                    self._pending_history = deque(pending, maxlen=HISTORY_LIMIT)
+
+                self._hist_cache = None
+                cursor = conn.execute(_SQL_REMOVE_HISTORY, (word,))
                 conn.commit()
-                deleted = cursor.rowcount > 0
+                deleted = deleted or cursor.rowcount > 0
                 if deleted:
-                    logger.info(f"Видалено з історії: '{word}'")
+                    logger.debug("Видалено з історії: '%s'", word)
                 return deleted
         except sqlite3.Error as e:
-            logger.error(f"Помилка видалення з історії: {e}")
+            logger.error("Помилка видалення з історії: %s", e)
             return False
 
     def add_to_favorites(self, word: str, translation: str = "") -> bool:
@@ -238,21 +517,45 @@ class DatabaseManager:
             bool: True якщо успішно додано, False якщо вже існує або помилка.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    'INSERT OR IGNORE INTO favorites (word, translation, added_at) VALUES (?, ?, ?)',
-                    (word, translation, datetime.datetime.now())
-                )
+            with self._lock, self._get_connection() as conn:
+                self._fav_cache = None
+                self._fav_words = None
+                cursor = conn.execute(_SQL_ADD_FAVORITE, (word, translation))
                 conn.commit()
                 if cursor.rowcount > 0:
-                    logger.info(f"Додано до улюблених: '{word}'")
+                    logger.debug("Додано до улюблених: '%s'", word)
                     return True
                 return False  # Вже існує
         except sqlite3.Error as e:
-            logger.error(f"Помилка додавання до улюблених: {e}")
+            logger.error("Помилка додавання до улюблених: %s", e)
             return False
 
+    def add_to_favorites_bulk(self, items: Iterable[Tuple[str, str]]) -> int:
+        """
+        Додає кілька слів до улюблених однією транзакцією (executemany).
+
+        Args:
+            items (Iterable[Tuple[str, str]]): Пари (слово, переклад).
+
+        Returns:
+            int: Кількість реально доданих слів (існуючі пропускаються).
+        """
+        rows = [(word, translation) for word, translation in items]
+        if not rows:
+            return 0
+        try:
+            with self._lock, self._get_connection() as conn:
+                self._fav_cache = None
+                self._fav_words = None
+                cursor = conn.executemany(_SQL_ADD_FAVORITE, rows)
+                conn.commit()
+                added = max(cursor.rowcount, 0)
+                logger.debug("Додано до улюблених: %s слів", added)
+                return added
+        except sqlite3.Error as e:
+            logger.error("Помилка пакетного додавання до улюблених: %s", e)
+            return 0
+
     def get_favorites(self) -> List[Tuple[str, str]]:
         """
         Отримує всі улюблені слова.
@@ -261,12 +564,15 @@ class DatabaseManager:
             List[Tuple[str, str]]: Список кортежів (слово, переклад).
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT word, translation FROM favorites ORDER BY added_at DESC')
-                return cursor.fetchall()
+            with self._lock:
+                if self._fav_cache is not None:
+                    return list(self._fav_cache)
+
+                with self._read_lock, self._get_read_connection() as conn:
+                    self._fav_cache = conn.execute(_SQL_GET_FAVORITES).fetchall()
+                    return list(self._fav_cache)
         except sqlite3.Error as e:
-            logger.error(f"Помилка отримання улюблених: {e}")
+            logger.error("Помилка отримання улюблених: %s", e)
             return []
 
     def remove_from_favorites(self, word: str) -> bool:
@@ -280,13 +586,14 @@ class DatabaseManager:
             bool: True якщо успішно видалено, False інакше.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM favorites WHERE word = ?', (word,))
+            with self._lock, self._get_connection() as conn:
+                self._fav_cache = None
+                self._fav_words = None
+                cursor = conn.execute(_SQL_REMOVE_FAVORITE, (word,))
                 conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
-            logger.error(f"Помилка видалення з улюблених: {e}")
+            logger.error("Помилка видалення з улюблених: %s", e)
             return False
 
     def is_favorite(self, word: str) -> bool:
@@ -300,13 +607,15 @@ class DatabaseManager:
             bool: True якщо слово в улюблених, False інакше.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT COUNT(*) FROM favorites WHERE word = ?', (word,))
-                result = cursor.fetchone()
-                return result[0] > 0 if result else False
+            with self._lock:
+                if self._fav_words is None:
+                    if self._fav_cache is None:
+                        with self._read_lock, self._get_read_connection() as conn:
+                            self._fav_cache = conn.execute(_SQL_GET_FAVORITES).fetchall()
+                    self._fav_words = {fav_word for fav_word, _ in self._fav_cache}
+                return word in self._fav_words
         except sqlite3.Error as e:
-            logger.error(f"Помилка перевірки улюбленого: {e}")
+            logger.error("Помилка перевірки улюбленого: %s", e)
             return False
 
     # Alias methods for compatibility with user's requested naming
@@ -347,13 +656,11 @@ class DatabaseManager:
             str: Значення налаштування або default.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-                row = cursor.fetchone()
+            with self._read_lock, self._get_read_connection() as conn:
+                row = conn.execute(_SQL_GET_SETTING, (key,)).fetchone()
                 return row[0] if row else default
         except sqlite3.Error as e:
-            logger.error(f"Помилка отримання налаштування: {e}")
+            logger.error("Помилка отримання налаштування: %s", e)
             return default
 
     def set_setting(self, key: str, value: str) -> bool:
@@ -368,26 +675,85 @@ class DatabaseManager:
             bool: True якщо успішно збережено, False інакше.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
-                    (key, value)
-                )
+            with self._lock, self._get_connection() as conn:
+                conn.execute(_SQL_SET_SETTING, (key, value))
                 conn.commit()
                 return True
         except sqlite3.Error as e:
-            logger.error(f"Помилка збереження налаштування: {e}")
+            logger.error("Помилка збереження налаштування: %s", e)
             return False
 
-    def close(self):
+    def get_wotd(self, date: str) -> Optional[str]:
+        """
+        Отримує збережене слово дня за дату.
+
+        Args:
+            date (str): Дата у форматі YYYY-MM-DD.
+
+        Returns:
+            Optional[str]: Сира відповідь сервера ("слово|визначення") або None.
+        """
+        try:
+            with self._read_lock, self._get_read_connection() as conn:
+                row = conn.execute(_SQL_GET_WOTD, (date,)).fetchone()
+                return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.error("Помилка отримання слова дня: %s", e)
+            return None
+
+    def set_wotd(self, date: str, payload: str) -> bool:
         """
-        Закриває з'єднання з базою даних.
+        Зберігає слово дня за дату (записи інших дат видаляються).
+
+        Args:
+            date (str): Дата у форматі YYYY-MM-DD.
+            payload (str): Сира відповідь сервера ("слово|визначення").
+
+        Returns:
+            bool: True якщо успішно збережено, False інакше.
         """
-        if self.connection:
-            self.connection.close()
-            logger.info("З'єднання з базою даних закрито")
+        try:
+            with self._lock, self._get_connection() as conn:
+                conn.execute(_SQL_SET_WOTD, (date, payload, int(time.time())))
+                conn.execute(_SQL_PRUNE_WOTD, (date,))
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            logger.error("Помилка збереження слова дня: %s", e)
+            return False
 
-    def __del__(self):
-        """Деструктор - закриває з'єднання."""
+    def close(self):
+        """
+        Закриває з'єднання з базою даних. Ідемпотентна операція.
+        """
+        with self._lock:
+            # Дописуємо буфер історії перед закриттям
+            if self.connection:
+                self._flush_history()
+                # Лічильник обрізання живе лише в пам'яті: сесія з меншою за
+                # HISTORY_PRUNE_INTERVAL кількістю вставок обрізає історію тут
+                if self._history_inserts_since_prune:
+                    try:
+                        self.connection.execute(_SQL_PRUNE_HISTORY)
+                        self.connection.commit()
+                        self._history_inserts_since_prune = 0
+                    except sqlite3.Error as e:
+                        logger.error("Помилка обрізання історії: %s", e)
+            if self._read_connection:
+                with self._read_lock:
+                    self._read_connection.close()
+                self._read_connection = None
+                self._read_lock = self._lock
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+                logger.info("З'єднання з базою даних закрито")
+            self._closed = True
+
+    def __enter__(self):
+        """Підтримка контекстного менеджера: with DatabaseManager(...) as db."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Закриває з'єднання при виході з блоку with."""
         self.close()
@@ -14,14 +14,69 @@ main.py
 
 import os
 import sys
-import ctypes
+import queue
 import logging
+import logging.handlers
+
+# --- Налаштування логування ---
+LOG_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_FILE = os.path.join(LOG_DIR, "client_log.txt")
+
+logger = logging.getLogger("DictionaryClient")
+
+
+def _setup_logging() -> logging.handlers.QueueListener:
+    """
+    Налаштовує логування у файл LOG_FILE та консоль.
+
+    Виклики logger.* лише кладуть запис у чергу, а запис у файл та консоль
+    виконує фоновий потік QueueListener - UI потік не чекає на I/O.
+    Викликається лише при запуску застосунку, а не при імпорті модуля.
+
+    Returns:
+        logging.handlers.QueueListener: Запущений слухач черги (зупиняється в main).
+    """
+    log_formatter = logging.Formatter(
+        '%(asctime)s | %(levelname)-8s | %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+    file_handler.setFormatter(log_formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(log_formatter)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    return log_listener
+
+
+def _setup_windows_console():
+    """
+    Підтримка кирилиці в консолі Windows та High DPI Awareness.
+
+    Викликається лише при запуску застосунку, а не при імпорті модуля.
+    """
+    if sys.platform != "win32":
+        return
+
+    import ctypes
 
-# --- Підтримка кирилиці в консолі Windows ---
-if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
-    os.system("chcp 65001 >nul 2>&1")
+
+    # UTF-8 кодова сторінка консолі напряму через Win32 (без запуску cmd.exe /chcp)
+    try:
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+        ctypes.windll.kernel32.SetConsoleCP(65001)
+    except Exception:
+        pass
 
     # High DPI Awareness для Windows
     try:
@@ -29,30 +84,6 @@ if sys.platform == "win32":
     except Exception:
         pass
 
-# --- Налаштування логування ---
-LOG_DIR = os.path.dirname(os.path.abspath(__file__))
-LOG_FILE = os.path.join(LOG_DIR, "client_log.txt")
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)-8s | %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger("DictionaryClient")
-
-# --- Налаштування CustomTkinter ---
-import customtkinter as ctk
-ctk.set_appearance_mode("light")
-ctk.set_default_color_theme("blue")
-
-# --- Імпорт модулів застосунку ---
-from network_manager import DictionaryClient
-from ui_components import ModernDictionaryApp
-
 
 def main():
     """
@@ -61,10 +92,23 @@ def main():
     Створює клієнт, передає його в GUI та запускає головний цикл.
     Забезпечує безпечне завершення з очищенням ресурсів.
     """
+    _setup_windows_console()
+    log_listener = _setup_logging()
+
     client = None
     app = None
     
     try:
+        # --- Налаштування CustomTkinter та імпорт модулів застосунку ---
+        # Імпортуються ліниво: Tk стек завантажується лише при запуску GUI,
+        # а помилки імпорту потрапляють у лог через except нижче
+        import customtkinter as ctk
+        ctk.set_appearance_mode("light")
+        ctk.set_default_color_theme("blue")
+
+        from network_manager import DictionaryClient
+        from ui_components import ModernDictionaryApp
+
         # Створюємо клієнт для мережевих операцій
         client = DictionaryClient(
             host='127.0.0.1',
@@ -105,6 +149,8 @@ def main():
             logger.warning(f"Помилка очищення БД: {e}")
         
         logger.info("Застосунок завершено")
+        # Дописуємо записи з черги та зупиняємо фоновий потік логування
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -10,14 +10,92 @@ network_manager.py
 Дата: 2025
 """
 
+import asyncio
+import codecs
 import socket
+import select
 import time
 import logging
+import queue
+import random
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 
 # Отримуємо логер
 logger = logging.getLogger("DictionaryClient")
 
+# Розмір буфера для recv: типова відповідь сервера вміщується за один системний виклик
+RECV_BUFFER_SIZE = 65536
+
+# Розмір буфера прийому ядра (SO_RCVBUF), щоб великі визначення не впирались у TCP-вікно
+SOCKET_RCVBUF_SIZE = 262144
+
+# Максимальна кількість перекладів у локальному LRU-кеші translate()
+TRANSLATE_CACHE_SIZE = 4096
+
+# Час життя запису кешу перекладів у секундах: зміни словника, зроблені
+# іншими клієнтами, стають видимими не пізніше ніж через цей час
+TRANSLATE_CACHE_TTL = 300.0
+
+# Запобіжник (circuit breaker): після стількох поспіль невдалих запитів
+# наступні запити одразу повертають "" протягом CIRCUIT_OPEN_SECONDS
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 10.0
+
+# Скільки чекати на NUL після "PONG\n" при підключенні, перш ніж вважати
+# сервер старою збіркою, що завершує відповіді лише '\n'
+FRAMING_PROBE_GRACE = 0.2
+
+# Заздалегідь закодовані префікси команд протоколу
+_CMDS = {
+    'TRANSLATE': b"TRANSLATE|",
+    'ADD': b"ADD|",
+    'DELETE': b"DELETE|",
+    'UPDATE': b"UPDATE|",
+}
+_SEP = b"|"
+_PIPE_NL = b"|\n"
+_NL = b"\n"
+# Сервер завершує кожну відповідь байтом NUL (визначення самі містять '\n')
+_NUL = b"\0"
+_PING = b"PING|\n"
+# Команди, що змінюють словник і тому скидають кеш перекладів
+_MUTATING_PREFIXES = ('ADD', 'UPDATE', 'DELETE')
+
+# Сервер ділить команду по '|' без жодного екранування, тому '|' у тексті
+# користувача обрізав би поле. Замінюємо його на схожий '¦'. У ключах (слово,
+# headword) переноси рядків теж прибираємо; у визначеннях вони допустимі,
+# бо сервер читає всю команду одним recv().
+_FIELD_ESCAPES = str.maketrans({'|': '¦'})
+_KEY_ESCAPES = str.maketrans({'|': '¦', '\n': ' ', '\r': ' '})
+
+
+def _encode_key(text: str) -> bytes:
+    """
+    Кодує слово-ключ команди, прибираючи символи, що ламають протокол.
+
+    Args:
+        text (str): Слово або headword.
+
+    Returns:
+        bytes: Безпечне для протоколу значення в UTF-8.
+    """
+    return text.translate(_KEY_ESCAPES).encode('utf-8')
+
+
+def _encode_field(text: str) -> bytes:
+    """
+    Кодує довільне текстове поле команди (визначення), замінюючи '|'.
+
+    Args:
+        text (str): Текст поля.
+
+    Returns:
+        bytes: Безпечне для протоколу значення в UTF-8.
+    """
+    return text.translate(_FIELD_ESCAPES).encode('utf-8')
+
 
 class DictionaryClient:
     """
@@ -33,6 +111,12 @@ class DictionaryClient:
         connected (bool): Статус з'єднання.
         timeout (float): Таймаут з'єднання в секундах.
 
+    Note:
+        Сокет працює з TCP_NODELAY: команди протоколу короткі (десятки байт)
+        і кожна чекає на відповідь, тому алгоритм Нейгла разом із відкладеним
+        ACK додавав би до 40-200 мс на запит. Ціна - більше дрібних сегментів
+        у мережі, що для такого трафіку неістотно.
+
     Example:
         >>> client = DictionaryClient('127.0.0.1', 8080)
         >>> client.connect()
@@ -56,7 +140,22 @@ class DictionaryClient:
         self.timeout = timeout
         self.socket = None
         self.connected = False
-        self._socket_lock = threading.Lock()  # Захист доступу до сокета з різних потоків
+        self._socket_lock = threading.RLock()  # Захист доступу до сокета з різних потоків
+        self._addr = None  # Кешований результат getaddrinfo для швидкого перепідключення
+        self._consec_fail = 0  # Кількість невдалих запитів поспіль
+        self._open_until = 0.0  # До якого моменту (time.monotonic) запобіжник розімкнений
+        # Черга запитів (commands, recv_chunk, Future) для I/O потоку - єдиного власника send/recv
+        self._tx_q = queue.Queue()
+        self._io_thread = None
+        self._io_thread_lock = threading.Lock()
+        # LRU-кеш перекладів: слово -> (момент застарівання, відповідь сервера)
+        self._tr_cache = OrderedDict()
+        self._tr_cache_lock = threading.Lock()
+        # Буфер прийому, який повторно використовує I/O потік (recv_into без нових bytes на чанк)
+        self._rxbuf = bytearray(RECV_BUFFER_SIZE)
+        # Чи завершує сервер відповіді байтом NUL: None - ще не перевірено.
+        # PING виконується лише при першому підключенні, перепідключення беруть збережене
+        self._nul_framed: bool | None = None
 
     def connect(self) -> bool:
         """
@@ -76,10 +175,24 @@ class DictionaryClient:
             self.connected = False
 
             try:
+                if self._addr is None:
+                    self._addr = socket.getaddrinfo(
+                        self.host, self.port, socket.AF_INET, socket.SOCK_STREAM
+                    )[0][4]
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                # Короткі команди не повинні чекати на алгоритм Нейгла
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                # Встановлюємо до connect(), бо масштаб вікна узгоджується під час handshake
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)
                 self.socket.settimeout(self.timeout)
-                self.socket.connect((self.host, self.port))
+                self.socket.connect(self._addr)
+                if self._nul_framed is None:
+                    self._detect_framing()
                 self.connected = True
+                # Успішне підключення замикає запобіжник
+                self._consec_fail = 0
+                self._open_until = 0.0
                 logger.info(f"[КЛІЄНТ] ✅ Підключено до {self.host}:{self.port}")
                 return True
             except (ConnectionRefusedError, socket.timeout, OSError) as e:
@@ -105,32 +218,275 @@ class DictionaryClient:
                     self.socket = None
                 return False
 
-    def send_command(self, command: str, recv_chunk: int = 4096) -> str:
+    def _detect_framing(self) -> None:
+        """
+        Визначає, чи завершує сервер відповіді байтом NUL (PING одразу після підключення).
+
+        Поточна збірка сервера відповідає "PONG\n\0", старіша - лише "PONG\n";
+        для неї кінець відповіді й далі визначається за '\n' (див. _send_once).
+        Викликається один раз на клієнт: результат зберігається в self._nul_framed,
+        тож перепідключення не платять за PING та FRAMING_PROBE_GRACE.
+
+        Raises:
+            OSError: Якщо сервер не відповів на PING до таймауту або закрив з'єднання.
+        """
+        sock = self.socket
+        sock.sendall(_PING)
+        reply = b""
+        while not reply.endswith((_NL, _NUL)):
+            chunk = sock.recv(16)
+            if not chunk:
+                raise ConnectionResetError("з'єднання закрито сервером")
+            reply += chunk
+        # NUL відправляється тим самим send(), тож зазвичай уже в сокеті
+        if reply.endswith(_NL) and select.select([sock], [], [], FRAMING_PROBE_GRACE)[0]:
+            reply += sock.recv(16)
+        self._nul_framed = reply.endswith(_NUL)
+        logger.debug("[КЛІЄНТ] Кінець відповіді: %s", "NUL" if self._nul_framed else "'\\n' (стара збірка сервера)")
+
+    def send_command(self, command: str, recv_chunk: int = RECV_BUFFER_SIZE) -> str:
+        """
+        Ставить команду в чергу I/O потоку та чекає на відповідь.
+
+        Усі send/recv виконує один потік, тому запити з різних потоків UI
+        не конкурують за сокет і не перемежовуються на ньому.
+
+        Args:
+            command (str): Команда для відправки
+            recv_chunk (int): Розмір буфера для recv. За замовчуванням RECV_BUFFER_SIZE.
+
+        Returns:
+            str: Відповідь сервера (може бути порожнім рядком при помилках)
+        """
+        if command.startswith(_MUTATING_PREFIXES):
+            self.clear_translate_cache()
+        return self.send_commands([command], recv_chunk)[0]
+
+    def _send_encoded(self, full_cmd: bytes) -> str:
+        """
+        Відправляє вже закодовану команду, що закінчується '\n'.
+
+        Args:
+            full_cmd (bytes): Команда протоколу в UTF-8.
+
+        Returns:
+            str: Відповідь сервера (може бути порожнім рядком при помилках)
+        """
+        return self.send_commands([full_cmd])[0]
+
+    def send_commands(self, commands: list[str | bytes], recv_chunk: int = RECV_BUFFER_SIZE) -> list[str]:
+        """
+        Виконує пакет команд одним завданням I/O потоку.
+
+        Сервер обробляє кожен recv() як одну команду, тому команди не
+        конвеєризуються в одному sendall(), а йдуть послідовно send/recv,
+        але без повторної передачі між потоками для кожної з них.
+
+        Args:
+            commands (list[str | bytes]): Команди для відправки.
+            recv_chunk (int): Розмір буфера для recv. За замовчуванням RECV_BUFFER_SIZE.
+
+        Returns:
+            list[str]: Відповіді сервера в порядку команд.
+        """
+        return [reply for reply, _ in self._send_commands_framed(commands, recv_chunk)]
+
+    def _send_commands_framed(self, commands: list[str | bytes],
+                              recv_chunk: int = RECV_BUFFER_SIZE) -> list[tuple[str, bool]]:
+        """
+        Як send_commands(), але разом з кожною відповіддю повертає ознаку її цілісності.
+
+        Args:
+            commands (list[str | bytes]): Команди для відправки.
+            recv_chunk (int): Розмір буфера для recv.
+
+        Returns:
+            list[tuple[str, bool]]: Пари (відповідь, кінець підтверджено термінатором).
+        """
+        if not commands:
+            return []
+        if threading.current_thread() is self._io_thread:
+            # Виклик з самого I/O потоку - виконуємо напряму, щоб уникнути взаємоблокування
+            return [self._execute_command(command, recv_chunk) for command in commands]
+
+        return self._submit(commands, recv_chunk).result()
+
+    def _submit(self, commands: list[str | bytes], recv_chunk: int) -> Future:
+        """
+        Ставить пакет команд у чергу I/O потоку.
+
+        Args:
+            commands (list[str | bytes]): Команди для відправки.
+            recv_chunk (int): Розмір буфера для recv.
+
+        Returns:
+            Future: Майбутній список пар (відповідь, кінець підтверджено термінатором).
+        """
+        self._ensure_io_thread()
+        fut = Future()
+        self._tx_q.put((list(commands), recv_chunk, fut))
+        return fut
+
+    # Асинхронний API для asyncio-циклів: не блокує цикл, використовує те саме з'єднання
+    async def send_command_async(self, command: str | bytes, recv_chunk: int = RECV_BUFFER_SIZE) -> str:
+        """
+        Асинхронний варіант send_command().
+
+        Запит виконує той самий I/O потік, а корутина лише чекає на його
+        Future. Окреме asyncio-з'єднання не відкривається: сервер обслуговує
+        клієнтів по одному, тож друге з'єднання чекало б у черзі accept().
+
+        Args:
+            command (str | bytes): Команда для відправки
+            recv_chunk (int): Розмір буфера для recv. За замовчуванням RECV_BUFFER_SIZE.
+
+        Returns:
+            str: Відповідь сервера (може бути порожнім рядком при помилках)
+        """
+        if isinstance(command, str) and command.startswith(_MUTATING_PREFIXES):
+            self.clear_translate_cache()
+        results = await asyncio.wrap_future(self._submit([command], recv_chunk))
+        return results[0][0]
+
+    async def translate_async(self, word: str) -> str:
+        """
+        Асинхронний переклад слова через сервер.
+
+        Args:
+            word (str): Слово для перекладу.
+
+        Returns:
+            str: Переклад або порожній рядок при помилці.
+        """
+        result = self._cache_get(word)
+        if result is None:
+            future = self._submit([_CMDS['TRANSLATE'] + _encode_key(word) + _PIPE_NL], RECV_BUFFER_SIZE)
+            result, framed = (await asyncio.wrap_future(future))[0]
+            if framed:
+                self._cache_put(word, result)
+        return result
+
+    async def connect_async(self) -> bool:
+        """
+        Асинхронний варіант connect().
+
+        Блокуючий connect() (з таймаутом) виконується у виконавці циклу,
+        щоб корутина не зупиняла сам цикл на час handshake.
+
+        Returns:
+            bool: True якщо підключення успішне, False інакше.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.connect)
+
+    async def add_word_async(self, ukrainian: str, english: str) -> str:
+        """
+        Асинхронне додавання нового слова до словника.
+
+        Args:
+            ukrainian (str): Українське слово.
+            english (str): Англійський переклад.
+
+        Returns:
+            str: Відповідь сервера ('ADDED', 'EXIST') або порожній рядок при помилці.
+        """
+        self.clear_translate_cache()
+        return await self.send_command_async(
+            _CMDS['ADD'] + _encode_key(ukrainian) + _SEP + _encode_field(english) + _NL
+        )
+
+    def _ensure_io_thread(self) -> None:
+        """
+        Ліниво запускає фоновий I/O потік, якщо він ще не працює.
+        """
+        with self._io_thread_lock:
+            if self._io_thread is None or not self._io_thread.is_alive():
+                self._io_thread = threading.Thread(
+                    target=self._io_loop, name="DictionaryClientIO", daemon=True
+                )
+                self._io_thread.start()
+
+    def _io_loop(self) -> None:
+        """
+        Цикл I/O потоку: по черзі виконує запити з черги та передає результати у Future.
+        """
+        while True:
+            item = self._tx_q.get()
+            if item is None:
+                break
+            commands, recv_chunk, fut = item
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result([self._execute_command(command, recv_chunk) for command in commands])
+            except Exception as e:
+                fut.set_exception(e)
+
+    def _execute_command(self, command: str | bytes, recv_chunk: int) -> tuple[str, bool]:
         """
         Відправляє команду з надійною обробкою помилок, часткових UTF-8 кадрів та таймаутів.
         
         Особливості:
-        - Використовує settimeout для send/recv операцій
-        - Накопичує байти в список parts та намагається декодувати після кожного чанка
-        - Обробляє UnicodeDecodeError для неповних байтів UTF-8
-        - Використовує deadline на основі timeout для переривання циклу
-        - Безпечно обробляє помилки сокетів та завжди відновлює попередній timeout
+        - Швидкий шлях: при активному з'єднанні одна спроба без циклу повторів
+        - Повільний шлях з перепідключенням лише після помилки швидкого
+        - Таймаут сокета встановлюється один раз у connect() і тут не змінюється
+        - Безпечно обробляє помилки сокетів
         
         Args:
-            command (str): Команда для відправки
-            recv_chunk (int): Розмір буфера для recv. За замовчуванням 4096.
+            command (str | bytes): Команда для відправки (bytes - вже закодована, з '\n')
+            recv_chunk (int): Розмір буфера для recv. За замовчуванням RECV_BUFFER_SIZE.
             
         Returns:
-            str: Відповідь сервера (може бути порожнім рядком при помилках)
+            tuple[str, bool]: Відповідь сервера (може бути порожнім рядком при
+            помилках) та ознака, що її кінець підтверджено термінатором.
+        """
+        if time.monotonic() < self._open_until:
+            # Сервер недоступний - не витрачаємо секунди на повторні спроби
+            logger.debug("[КЛІЄНТ] Запобіжник розімкнений, запит пропущено")
+            return "", False
+
+        # Підготовка команди (обгортки передають вже закодовані байти)
+        if isinstance(command, bytes):
+            full_cmd = command
+        else:
+            if not command.endswith('\n'):
+                command = command + '\n'
+            full_cmd = command.encode('utf-8')
+
+        sock = self.socket
+        if self.connected and sock is not None:
+            try:
+                result = self._send_once(sock, full_cmd, recv_chunk)
+                self._consec_fail = 0
+                return result
+            except OSError as e:
+                logger.warning(f"[КЛІЄНТ] ⚠️ Втрачено з'єднання ({e}). Перепідключення...")
+                self._reset_socket()
+            except Exception as e:
+                logger.error(f"[КЛІЄНТ] ❌ Неочікувана помилка: {e}")
+                self._reset_socket()
+            # Перша спроба вже витрачена на швидкий шлях
+            return self._send_with_retry(full_cmd, recv_chunk, first_attempt=1)
+
+        return self._send_with_retry(full_cmd, recv_chunk)
+
+    def _send_with_retry(self, full_cmd: bytes, recv_chunk: int, first_attempt: int = 0) -> tuple[str, bool]:
+        """
+        Повільний шлях: перепідключення з backoff та повторні спроби відправки.
+
+        Args:
+            full_cmd (bytes): Закодована команда з '\n'.
+            recv_chunk (int): Розмір буфера для recv.
+            first_attempt (int): Номер першої спроби (1, якщо швидкий шлях уже не вдався).
+
+        Returns:
+            tuple[str, bool]: Відповідь сервера (порожній рядок, якщо всі спроби
+            вичерпано) та ознака, що її кінець підтверджено термінатором.
         """
         max_retries = 3
         base_backoff = 0.5  # Початкова затримка в секундах
         max_backoff = 8.0   # Максимальна затримка
         
-        for attempt in range(max_retries):
-            sock = None
-            old_timeout = None
-            
+        for attempt in range(first_attempt, max_retries):
             try:
                 with self._socket_lock:
                     # Перевіряємо чи є активне з'єднання
@@ -138,8 +494,9 @@ class DictionaryClient:
                         if attempt == 0:
                             logger.info(f"[КЛІЄНТ] Спроба підключення {attempt + 1}/{max_retries}...")
                         else:
-                            # Експоненціальний backoff для повторних спроб
+                            # Експоненціальний backoff з jitter, щоб повтори клієнтів не синхронізувались
                             backoff = min(base_backoff * (2 ** (attempt - 1)), max_backoff)
+                            backoff *= 0.5 + random.random()
                             logger.info(f"[КЛІЄНТ] Retry #{attempt}: спроба перепідключення (backoff {backoff:.1f}s)...")
                             time.sleep(backoff)
                         
@@ -147,136 +504,203 @@ class DictionaryClient:
                             continue
                     
                     sock = self.socket
-                    # Зберігаємо поточний timeout для відновлення
-                    old_timeout = sock.gettimeout()
-                    sock.settimeout(self.timeout)
                 
-                # Підготовка команди
-                if not command.endswith('\n'):
-                    command = command + '\n'
-                full_cmd = command.encode('utf-8')
+                result = self._send_once(sock, full_cmd, recv_chunk)
+                self._consec_fail = 0
+                return result
                 
-                # Відправка команди
-                try:
-                    sock.sendall(full_cmd)
-                    logger.debug(f"[КЛІЄНТ] Відправлено команду: {command.strip()}")
-                except (BrokenPipeError, ConnectionResetError, OSError) as e:
-                    logger.warning(f"[КЛІЄНТ] ⚠️ Помилка відправки: {e}")
-                    with self._socket_lock:
-                        self.connected = False
-                        if self.socket:
-                            try:
-                                self.socket.close()
-                            except Exception:
-                                pass
-                            self.socket = None
-                    continue
-                
-                # Отримання відповіді з обробкою часткових UTF-8 кадрів
-                parts = []  # Список байтів для накопичення
-                deadline = time.time() + self.timeout
-                
-                while time.time() < deadline:
-                    try:
-                        chunk = sock.recv(recv_chunk)
-                        if not chunk:
-                            # Порожній чанк означає закриття з'єднання
-                            logger.debug("[КЛІЄНТ] Отримано порожній чанк (з'єднання закрито)")
-                            break
-                        
-                        parts.append(chunk)
-                        
-                        # Спробуємо декодувати накопичені дані
-                        raw = b"".join(parts)
-                        try:
-                            text = raw.decode('utf-8')
-                            # Якщо декодування успішне і отримали менше ніж recv_chunk байт,
-                            # або знайдено термінатор протоколу (якщо є), повертаємо результат
-                            if len(chunk) < recv_chunk:
-                                # Останній чанк - повертаємо результат
-                                result = text.strip()
-                                logger.debug(f"[КЛІЄНТ] Отримано відповідь ({len(raw)} байт)")
-                                return result
-                        except UnicodeDecodeError:
-                            # Неповний UTF-8 символ - продовжуємо отримувати дані
-                            logger.debug(f"[КЛІЄНТ] Неповний UTF-8 кадр, продовжуємо отримання...")
-                            continue
-                            
-                    except socket.timeout:
-                        # Таймаут при отриманні
-                        logger.warning(f"[КЛІЄНТ] ⚠️ Таймаут отримання даних")
-                        break
-                    except (ConnectionResetError, BrokenPipeError, OSError) as e:
-                        logger.warning(f"[КЛІЄНТ] ⚠️ Помилка отримання: {e}")
-                        with self._socket_lock:
-                            self.connected = False
-                            if self.socket:
-                                try:
-                                    self.socket.close()
-                                except Exception:
-                                    pass
-                                self.socket = None
-                        # Виходимо з циклу отримання, спробуємо перепідключитися
-                        break
-                
-                # Якщо вийшли з циклу, намагаємося декодувати те, що отримали
-                if parts:
-                    raw = b"".join(parts)
-                    try:
-                        # Толерантне декодування з заміною помилкових символів
-                        result = raw.decode('utf-8', errors='replace').strip()
-                        logger.debug(f"[КЛІЄНТ] Повертаємо часткову відповідь після таймауту/помилки")
-                        return result
-                    except Exception as e:
-                        logger.warning(f"[КЛІЄНТ] ⚠️ Помилка декодування: {e}")
-                        return ""
-                else:
-                    # Нічого не отримано
-                    logger.warning(f"[КЛІЄНТ] ⚠️ Порожня відповідь від сервера")
-                    with self._socket_lock:
-                        self.connected = False
-                        if self.socket:
-                            try:
-                                self.socket.close()
-                            except Exception:
-                                pass
-                            self.socket = None
-                    continue
-                
-            except (BrokenPipeError, ConnectionResetError, OSError) as e:
+            except OSError as e:
                 logger.warning(f"[КЛІЄНТ] ⚠️ Втрачено з'єднання ({e}). Перепідключення...")
-                with self._socket_lock:
-                    self.connected = False
-                    if self.socket:
-                        try:
-                            self.socket.close()
-                        except Exception:
-                            pass
-                        self.socket = None
+                self._reset_socket()
                 continue
             except Exception as e:
                 # Ловимо всі інші винятки для безпеки
                 logger.error(f"[КЛІЄНТ] ❌ Неочікувана помилка: {e}")
-                with self._socket_lock:
-                    self.connected = False
-                    if self.socket:
-                        try:
-                            self.socket.close()
-                        except Exception:
-                            pass
-                        self.socket = None
+                self._reset_socket()
                 continue
-            finally:
-                # Завжди відновлюємо попередній timeout
-                if sock and old_timeout is not None:
-                    try:
-                        sock.settimeout(old_timeout)
-                    except Exception:
-                        pass
         
         # Всі спроби вичерпано
         logger.error("[КЛІЄНТ] ❌ Не вдалося відправити запит після всіх спроб.")
-        return ""
+        self._consec_fail += 1
+        if self._consec_fail >= CIRCUIT_FAILURE_THRESHOLD:
+            self._open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+            logger.warning(
+                f"[КЛІЄНТ] ⚠️ {self._consec_fail} невдалих запитів поспіль - "
+                f"запити призупинено на {CIRCUIT_OPEN_SECONDS:.0f}s"
+            )
+        return "", False
+
+    def _send_once(self, sock: socket.socket, full_cmd: bytes, recv_chunk: int) -> tuple[str, bool]:
+        """
+        Одна спроба: відправка команди та читання відповіді до термінатора.
+
+        Сервер завершує кожну відповідь байтом NUL, тож внутрішні переноси
+        рядків у визначеннях не плутаються з кінцем повідомлення. Для старої
+        збірки сервера без NUL кінцем вважається '\n' в кінці отриманих даних,
+        після якого у сокеті більше нічого немає.
+
+        Після таймауту, обриву чи часткового читання сокет закривається:
+        залишок відповіді, що прийде пізніше, не стане відповіддю на наступну команду.
+
+        Args:
+            sock (socket.socket): Підключений сокет.
+            full_cmd (bytes): Закодована команда з '\n'.
+            recv_chunk (int): Розмір буфера для recv.
+
+        Returns:
+            tuple[str, bool]: Відповідь сервера (або її частина після таймауту
+            чи обриву) та ознака, що її кінець підтверджено термінатором
+            (NUL або, для старої збірки, '\n' без даних у сокеті).
+
+        Raises:
+            OSError: Якщо відправка не вдалась, у сокеті були застарілі дані
+            або не отримано жодного байта.
+        """
+        self._drain_stale_data(sock, recv_chunk)
+        sock.sendall(full_cmd)
+        if logger.isEnabledFor(logging.DEBUG):
+            # Декодуємо лише коли debug увімкнено - кирилиця в лозі без \x-екранування
+            logger.debug("[КЛІЄНТ] Відправлено команду: %s", full_cmd.decode('utf-8', 'replace').rstrip())
+        
+        # Інкрементальний декодер переносить розірвані між чанками UTF-8
+        # символи, тож кожен байт декодується один раз.
+        decoder = None  # Створюється лише для відповідей з кількох чанків
+        text_parts = []  # Список вже декодованих фрагментів
+        received = 0
+        rxview = self._get_rx_view(recv_chunk)
+        # Монотонний годинник не стрибає при синхронізації часу (NTP)
+        deadline = time.monotonic() + self.timeout
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                # Один select чекає на дані рівно до дедлайну запиту
+                readable = remaining > 0 and select.select([sock], [], [], remaining)[0]
+                if not readable:
+                    logger.warning("[КЛІЄНТ] ⚠️ Таймаут отримання даних")
+                    break
+                n = sock.recv_into(rxview)
+            except socket.timeout:
+                logger.warning("[КЛІЄНТ] ⚠️ Таймаут отримання даних")
+                break
+            except OSError as e:
+                if not received:
+                    raise
+                logger.warning(f"[КЛІЄНТ] ⚠️ Помилка отримання: {e}")
+                break
+            
+            if not n:
+                # Порожній чанк означає закриття з'єднання
+                logger.debug("[КЛІЄНТ] Отримано порожній чанк (з'єднання закрито)")
+                break
+            
+            received += n
+            if self._nul_framed:
+                # Термінатор NUL: відповідь завершена, сам NUL не декодуємо
+                framed = complete = rxview[n - 1] == 0
+                if complete:
+                    n -= 1
+            else:
+                # Стара збірка сервера: кінець - '\n', після якого нічого не чекає
+                framed = complete = rxview[n - 1] == 0x0A and not self._has_pending_data(sock)
+            
+            if complete and decoder is None:
+                # Уся відповідь прийшла одним чанком - декодуємо прямо з буфера
+                logger.debug("[КЛІЄНТ] Отримано відповідь (%d байт)", received)
+                return str(rxview[:n], 'utf-8', 'replace').strip(), framed
+            
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            text_parts.append(decoder.decode(rxview[:n], final=False))
+            
+            if complete:
+                text_parts.append(decoder.decode(b'', final=True))
+                logger.debug("[КЛІЄНТ] Отримано відповідь (%d байт)", received)
+                return ''.join(text_parts).strip(), framed
+        
+        if not received:
+            # Нічого не отримано - з'єднання вважаємо непридатним
+            raise ConnectionResetError("порожня відповідь від сервера")
+        
+        # Кінець відповіді не отримано: решта може прийти пізніше, тож сокет
+        # більше не використовуємо - наступна команда перепідключиться
+        self._reset_socket()
+        # Повертаємо те, що встигли отримати; незавершений UTF-8 символ стає U+FFFD
+        text_parts.append(decoder.decode(b'', final=True))
+        logger.debug("[КЛІЄНТ] Повертаємо часткову відповідь після таймауту/помилки")
+        return ''.join(text_parts).strip(), False
+
+    def _reset_socket(self) -> None:
+        """
+        Закриває поточний сокет і позначає клієнт як від'єднаний.
+        """
+        with self._socket_lock:
+            self.connected = False
+            if self.socket:
+                try:
+                    self.socket.close()
+                except Exception:
+                    pass
+                self.socket = None
+
+    def _get_rx_view(self, size: int) -> memoryview:
+        """
+        Повертає memoryview на буфер прийому потрібного розміру.
+
+        Буфер виділяється заново лише якщо запитаний розмір більший за поточний.
+
+        Args:
+            size (int): Кількість байт для одного recv_into.
+
+        Returns:
+            memoryview: Вікно на self._rxbuf довжиною size.
+        """
+        if len(self._rxbuf) < size:
+            self._rxbuf = bytearray(size)
+        return memoryview(self._rxbuf)[:size]
+
+    @staticmethod
+    def _has_pending_data(sock: socket.socket) -> bool:
+        """
+        Перевіряє без очікування, чи є в сокеті ще непрочитані байти.
+
+        Args:
+            sock (socket.socket): Сокет для перевірки.
+
+        Returns:
+            bool: True якщо recv() поверне дані одразу.
+        """
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+            return bool(readable)
+        except (OSError, ValueError):
+            return False
+
+    def _drain_stale_data(self, sock: socket.socket, recv_chunk: int) -> None:
+        """
+        Без очікування вичитує з сокета байти, що залишились від попередньої відповіді.
+
+        Залишок означає, що кінець попередньої відповіді було визначено
+        неправильно (стара збірка сервера без NUL). Межі повідомлень на такому
+        з'єднанні вже не можна довіряти, тож воно закривається.
+
+        Args:
+            sock (socket.socket): Сокет для очищення.
+            recv_chunk (int): Розмір буфера для recv.
+
+        Raises:
+            ConnectionResetError: Якщо сервер закрив з'єднання або в сокеті були застарілі дані.
+        """
+        dropped = 0
+        rxview = self._get_rx_view(recv_chunk)
+        while self._has_pending_data(sock):
+            n = sock.recv_into(rxview)
+            if not n:
+                raise ConnectionResetError("з'єднання закрито сервером")
+            dropped += n
+        if dropped:
+            logger.warning(f"[КЛІЄНТ] ⚠️ Відкинуто {dropped} байт застарілої відповіді")
+            raise ConnectionResetError("застарілі дані у сокеті - з'єднання розсинхронізоване")
 
     def disconnect(self) -> None:
         """
@@ -296,10 +720,59 @@ class DictionaryClient:
             self.connected = False
             logger.info("[КЛІЄНТ] Від'єднано від сервера")
 
+    def _cache_get(self, word: str) -> str | None:
+        """
+        Повертає переклад з кешу та позначає його як нещодавно використаний.
+
+        Args:
+            word (str): Слово для пошуку.
+
+        Returns:
+            str or None: Збережена відповідь або None, якщо її немає чи вона застаріла.
+        """
+        with self._tr_cache_lock:
+            entry = self._tr_cache.get(word)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if time.monotonic() >= expires_at:
+                del self._tr_cache[word]
+                return None
+            self._tr_cache.move_to_end(word)
+            return result
+
+    def _cache_put(self, word: str, result: str) -> None:
+        """
+        Зберігає переклад у кеші, витісняючи найдавніший при переповненні.
+
+        Викликається лише для відповідей, кінець яких підтверджено термінатором
+        (див. _send_once): часткові відповіді, відповіді після таймауту
+        чи розсинхронізації не кешуються.
+        Порожні відповіді (помилки мережі) теж не кешуються.
+
+        Args:
+            word (str): Слово.
+            result (str): Відповідь сервера.
+        """
+        if not result:
+            return
+        with self._tr_cache_lock:
+            self._tr_cache[word] = (time.monotonic() + TRANSLATE_CACHE_TTL, result)
+            self._tr_cache.move_to_end(word)
+            if len(self._tr_cache) > TRANSLATE_CACHE_SIZE:
+                self._tr_cache.popitem(last=False)
+
+    def clear_translate_cache(self) -> None:
+        """
+        Очищає кеш перекладів (після зміни словника або сервера).
+        """
+        with self._tr_cache_lock:
+            self._tr_cache.clear()
+
     # Зручні обгортки
     def translate(self, word: str) -> str | None:
         """
-        Переклад слова через сервер.
+        Переклад слова через сервер. Повторні запити обслуговуються з LRU-кешу.
 
         Args:
             word (str): Слово для перекладу.
@@ -307,7 +780,33 @@ class DictionaryClient:
         Returns:
             str or None: Переклад або None при помилці.
         """
-        return self.send_command(f"TRANSLATE|{word}|")
+        result = self._cache_get(word)
+        if result is None:
+            result, framed = self._send_commands_framed([_CMDS['TRANSLATE'] + _encode_key(word) + _PIPE_NL])[0]
+            if framed:
+                self._cache_put(word, result)
+        return result
+
+    def translate_many(self, words: list[str]) -> list[str]:
+        """
+        Переклад списку слів одним пакетом.
+
+        Args:
+            words (list[str]): Слова для перекладу.
+
+        Returns:
+            list[str]: Переклади в тому ж порядку (порожній рядок при помилці).
+        """
+        results = [self._cache_get(word) for word in words]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            prefix = _CMDS['TRANSLATE']
+            fetched = self._send_commands_framed([prefix + _encode_key(words[i]) + _PIPE_NL for i in missing])
+            for i, (result, framed) in zip(missing, fetched):
+                results[i] = result
+                if framed:
+                    self._cache_put(words[i], result)
+        return results
 
     def add_word(self, ukrainian: str, english: str) -> str | None:
         """
@@ -320,7 +819,10 @@ class DictionaryClient:
         Returns:
             str or None: Відповідь сервера ('ADDED', 'EXIST') або None.
         """
-        return self.send_command(f"ADD|{ukrainian}|{english}")
+        self.clear_translate_cache()
+        return self._send_encoded(
+            _CMDS['ADD'] + _encode_key(ukrainian) + _SEP + _encode_field(english) + _NL
+        )
 
     def delete_word(self, headword: str) -> str | None:
         """
@@ -332,7 +834,8 @@ class DictionaryClient:
         Returns:
             str or None: Відповідь сервера ('Success' або 'Error') або None.
         """
-        return self.send_command(f"DELETE|{headword}|")
+        self.clear_translate_cache()
+        return self._send_encoded(_CMDS['DELETE'] + _encode_key(headword) + _PIPE_NL)
 
     def update_word(self, headword: str, new_definition: str) -> str | None:
         """
@@ -345,10 +848,18 @@ class DictionaryClient:
         Returns:
             str or None: Відповідь сервера ('Success' або 'Error') або None.
         """
-        return self.send_command(f"UPDATE|{headword}|{new_definition}")
+        self.clear_translate_cache()
+        return self._send_encoded(
+            _CMDS['UPDATE'] + _encode_key(headword) + _SEP + _encode_field(new_definition) + _NL
+        )
 
     def close(self):
         self.disconnect()
+        # Зупиняємо I/O потік після обробки вже поставлених запитів
+        with self._io_thread_lock:
+            if self._io_thread is not None and self._io_thread.is_alive():
+                self._tx_q.put(None)
+            self._io_thread = None
 
     def is_connected(self) -> bool:
         """
@@ -367,6 +878,8 @@ class DictionaryClient:
             host (str): Нова IP-адреса сервера.
         """
         self.host = host
+        self._addr = None
+        self.clear_translate_cache()
 
     def set_port(self, port: int) -> None:
         """
@@ -376,6 +889,8 @@ class DictionaryClient:
             port (int): Новий порт сервера.
         """
         self.port = port
+        self._addr = None
+        self.clear_translate_cache()
 
     def __repr__(self) -> str:
         status = "connected" if self.connected else "disconnected"
@@ -7,6 +7,7 @@ UI компоненти для електронного словника.
 - StatusIndicator: Індикатор статусу з'єднання
 - ResultCard: Картка результату перекладу
 - HistoryItem: Елемент історії пошуку
+- VirtualWordList: Віртуалізований список History / Favorites
 
 Автор: Dmytro Petruniv
 Версія: 2.0
@@ -15,9 +16,15 @@ UI компоненти для електронного словника.
 
 import customtkinter as ctk
 from tkinter import messagebox
+import tkinter.font as tkfont
 import logging
+import functools
 import re
 import html
+import asyncio
+import concurrent.futures
+import time
+from collections import deque
 from datetime import datetime
 import threading
 
@@ -83,6 +90,23 @@ POS_HEADERS = {
 }
 
 
+# Регулярні вирази для insert_formatted_text
+_POS_HEADER_LINE_RE = re.compile(r'^(\s*)(\[)\s*([A-Z][A-Z\s]*[A-Z]|[A-Z]+)\s*(\])(\s*)$')
+_BRACKET_TAG_RE = re.compile(r'(\[[^\]]+\])')
+_UPPER_TAG_RE = re.compile(r'^[A-Z\s]+$')
+
+# Жирний шрифт для POS headers; створюється один раз, коли вже існує корінь Tk
+_BOLD_FONT = None
+
+
+def _get_bold_font():
+    """Повертає спільний жирний шрифт, створюючи його при першому виклику."""
+    global _BOLD_FONT
+    if _BOLD_FONT is None:
+        _BOLD_FONT = tkfont.Font(family="Segoe UI", size=14, weight="bold")
+    return _BOLD_FONT
+
+
 def insert_formatted_text(textbox, text: str, tag_color: str = "#10B981"):
     """
     Вставляє відформатований текст у CTkTextbox з кольоровими тегами.
@@ -118,15 +142,15 @@ def insert_formatted_text(textbox, text: str, tag_color: str = "#10B981"):
     except AttributeError:
         pass
     
-    if inner_text:
+    # Теги налаштовуються один раз на віджет (і повторно лише при зміні кольору)
+    if inner_text and getattr(textbox, '_ui_tags_color', None) != tag_color:
         # Налаштовуємо теги через внутрішній Text widget
         try:
-            import tkinter.font as tkfont
             # Звичайний тег для абревіатур
             inner_text.tag_config(tag_name, foreground=tag_color)
             # Жирний тег для POS headers (POS_TAG: [NOUN], [VERB] etc.)
-            bold_font = tkfont.Font(family="Segoe UI", size=14, weight="bold")
-            inner_text.tag_config(bold_tag_name, font=bold_font, foreground=tag_color)
+            inner_text.tag_config(bold_tag_name, font=_get_bold_font(), foreground=tag_color)
+            textbox._ui_tags_color = tag_color
         except Exception as e:
             logger.warning(f"Не вдалося налаштувати теги: {e}")
             # Fallback: використовуємо тільки колір без жирного шрифту
@@ -136,83 +160,331 @@ def insert_formatted_text(textbox, text: str, tag_color: str = "#10B981"):
             except Exception:
                 pass
     
-    # Розбиваємо текст на рядки
-    lines = text.split('\n')
+    # Збираємо сегменти (текст, тег) і вставляємо їх одним викликом Tk,
+    # а не окремим insert на кожен шматок рядка
+    segments = []
     
-    for line in lines:
+    for line in text.split('\n'):
         if not line.strip():
             # Порожній рядок
-            textbox.insert("end", "\n")
+            segments.append(("\n", None))
             continue
         
         # Перевіряємо чи це POS header (формат: [ NOUN ], [ VERB ], [ PHRASAL VERB ] тощо)
         # Може бути з пробілами: [ NOUN ] або без: [NOUN]
-        pos_match = re.match(r'^(\s*)(\[)\s*([A-Z][A-Z\s]*[A-Z]|[A-Z]+)\s*(\])(\s*)$', line)
+        pos_match = _POS_HEADER_LINE_RE.match(line)
         if pos_match:
             # Це POS header - виділяємо його жирним та кольором
-            prefix = pos_match.group(1)
-            bracket_open = pos_match.group(2)
-            pos_text = pos_match.group(3).strip()
-            bracket_close = pos_match.group(4)
-            suffix = pos_match.group(5)
-            
-            if prefix:
-                textbox.insert("end", prefix)
-            textbox.insert("end", bracket_open, bold_tag_name)
-            textbox.insert("end", f" {pos_text} ", bold_tag_name)
-            textbox.insert("end", bracket_close, bold_tag_name)
-            if suffix:
-                textbox.insert("end", suffix)
-            textbox.insert("end", "\n")
+            prefix, bracket_open, pos_text, bracket_close, suffix = pos_match.groups()
+            segments.append((prefix, None))
+            segments.append((f"{bracket_open} {pos_text.strip()} {bracket_close}", bold_tag_name))
+            segments.append((suffix + "\n", None))
             continue
         
-        # Обробляємо рядок з можливими абревіатурами
-        remaining_line = line
+        # Обробляємо рядок з можливими абревіатурами у квадратних дужках
         last_end = 0
-        
-        # Regex для знаходження всіх квадратних дужок (абревіатури)
-        abbr_pattern = r'(\[[^\]]+\])'
-        matches = list(re.finditer(abbr_pattern, remaining_line))
-        
-        if matches:
-            # Є теги - вставляємо по частинах
-            for match in matches:
-                # Текст до тегу
-                before = remaining_line[last_end:match.start()]
-                if before:
-                    textbox.insert("end", before)
-                
-                # Перевіряємо чи це POS header (великі літери) чи абревіатура
-                tag_text = match.group(1)
-                tag_content = tag_text.strip('[]').strip()
-                
-                # Якщо це POS header (тільки великі літери та пробіли)
-                if re.match(r'^[A-Z\s]+$', tag_content):
-                    # Використовуємо жирний тег
-                    textbox.insert("end", tag_text, bold_tag_name)
-                else:
-                    # Це абревіатура - звичайний кольоровий тег
-                    textbox.insert("end", tag_text, tag_name)
-                
-                last_end = match.end()
+        for match in _BRACKET_TAG_RE.finditer(line):
+            # Текст до тегу
+            segments.append((line[last_end:match.start()], None))
             
-            # Залишок рядка після останнього тегу
-            if last_end < len(remaining_line):
-                textbox.insert("end", remaining_line[last_end:])
-        else:
-            # Немає тегів - вставляємо як звичайний текст
-            textbox.insert("end", line)
+            tag_text = match.group(1)
+            tag_content = tag_text.strip('[]').strip()
+            # POS header (тільки великі літери та пробіли) - жирний, інакше абревіатура
+            if _UPPER_TAG_RE.match(tag_content):
+                segments.append((tag_text, bold_tag_name))
+            else:
+                segments.append((tag_text, tag_name))
+            
+            last_end = match.end()
         
-        textbox.insert("end", "\n")
+        # Залишок рядка після останнього тегу (або весь рядок, якщо тегів немає)
+        segments.append((line[last_end:] + "\n", None))
+    
+    # Зливаємо сусідні сегменти з однаковим тегом
+    merged = []
+    for chunk, tag in segments:
+        if not chunk:
+            continue
+        if merged and merged[-1][1] == tag:
+            merged[-1][0].append(chunk)
+        else:
+            merged.append(([chunk], tag))
+    
+    if inner_text:
+        # Text.insert приймає пари (текст, теги) - весь вміст за один виклик Tcl
+        args = []
+        for chunks, tag in merged:
+            args.append(''.join(chunks))
+            args.append(tag or ())
+        if args:
+            inner_text.insert("end", *args)
+    else:
+        for chunks, tag in merged:
+            textbox.insert("end", ''.join(chunks), tag)
     
-    # Налаштовуємо базовий шрифт для всього тексту (DEF: Definition text)
-    textbox.configure(font=("Segoe UI", 16))
+    # Налаштовуємо базовий шрифт для всього тексту (DEF: Definition text);
+    # configure(font=...) перераховує розмітку віджета, тому робимо це один раз на віджет
+    if not getattr(textbox, '_ui_font_set', False):
+        textbox.configure(font=("Segoe UI", 16))
+        textbox._ui_font_set = True
 
 
+def _set_textbox_text(textbox, text: str):
+    """
+    Замінює вміст вимкненого (read-only) textbox одним блоком normal/insert/disabled.
+
+    Args:
+        textbox: CTkTextbox віджет.
+        text: Новий текст.
+    """
+    textbox.configure(state="normal")
+    textbox.delete("1.0", "end")
+    textbox.insert("1.0", text)
+    textbox.configure(state="disabled")
+
+
+# --- Скомпільовані регулярні вирази для format_and_display ---
+# Компілюються один раз при імпорті, щоб кожен виклик не залежав від кешу модуля re
+
+# Повний список абревіатур, які зустрічаються в словниках
+# Формат: (abbreviation, display_text)
+_ABBREVIATIONS = [
+    # Стилістичні позначки
+    ('розм.', 'розм.'),           # розмовне
+    ('книжк.', 'книжк.'),         # книжне
+    ('поет.', 'поет.'),           # поетичне
+    ('жарт.', 'жарт.'),           # жартівливе
+    ('ірон.', 'ірон.'),           # іронічне
+    ('зневажл.', 'зневажл.'),     # зневажливе
+    ('вульг.', 'вульг.'),         # вульгарне
+    ('прост.', 'прост.'),         # просторічне
+    ('діал.', 'діал.'),           # діалектне
+    ('застар.', 'застар.'),       # застаріле
+    ('рідко', 'рідко'),           # рідковживане
+
+    # Галузеві позначки
+    ('мор.', 'мор.'),             # морський термін
+    ('військ.', 'військ.'),       # військовий
+    ('зоол.', 'зоол.'),           # зоологія
+    ('бот.', 'бот.'),             # ботаніка
+    ('мед.', 'мед.'),             # медицина
+    ('юр.', 'юр.'),               # юридичний
+    ('тех.', 'тех.'),             # технічний
+    ('фіз.', 'фіз.'),             # фізика
+    ('хім.', 'хім.'),             # хімія
+    ('матем.', 'матем.'),         # математика
+    ('муз.', 'муз.'),             # музика
+    ('спорт.', 'спорт.'),         # спорт
+    ('авіа.', 'авіа.'),           # авіація
+    ('ел.', 'ел.'),               # електрика
+    ('рел.', 'рел.'),             # релігія
+    ('біол.', 'біол.'),           # біологія
+    ('геол.', 'геол.'),           # геологія
+    ('екон.', 'екон.'),           # економіка
+    ('політ.', 'політ.'),         # політика
+
+    # Географічні позначки
+    ('амер.', 'амер.'),           # американізм
+    ('брит.', 'брит.'),           # британізм
+    ('шотл.', 'шотл.'),           # шотландізм
+    ('австрал.', 'австрал.'),     # австралійський
+
+    # Граматичні позначки
+    ('pl', 'мн.'),                # множина (plural)
+    ('sg', 'одн.'),               # однина (singular)
+    ('перен.', 'перен.'),         # переносне значення
+    ('букв.', 'букв.'),           # буквально
+    ('збірн.', 'збірн.'),         # збірне
+    ('скор.', 'скор.'),           # скорочення
+    ('attr', 'означ.'),           # attributive / означальне
+    ('pred', 'присуд.'),          # predicative / присудкове
+]
+
+_LINK_RE = re.compile(r'<<\s*([^<>]+?)\s*>>')
+_QUOTE_GT_RE = re.compile(r'(?m)^\s*>+\s*')
+_PIPE_GROUP_RE = re.compile(r'\(([^()]*\|[^()]*)\)')
+_ALPHA_TOKEN_RE = re.compile(r'^[A-Za-z\- ]+$')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_DSL_BLOCK_RE = re.compile(r'\[(?![ ]*(NOUN|VERB|ADJECTIVE|ADVERB|PREPOSITION|CONJUNCTION|PRONOUN|INTERJECTION|NUMERAL|PHRASAL VERB)[ ]*\])[^]]*\]')
+_NUM_PREFIX_RE = re.compile(r'^\s*\d+\.\s*', re.MULTILINE)
+
+# --- Однопрохідна заміна скорочень, абревіатур та частин мови ---
+# Кирилічні абревіатури мають межі через негативний lookaround (\b не працює з
+# кирилицею): "не після / не перед літерою" покриває і початок, і кінець рядка
+# без окремої альтернативи ^|$. Латинські - через \b.
+# Ключі мапи - нижній регістр, як їх бачить колбек.
+_ABBR_CYRILLIC = [abbr for abbr, _ in _ABBREVIATIONS if not abbr.isascii()]
+_ABBR_LATIN = [abbr for abbr, _ in _ABBREVIATIONS if abbr.isascii()]
+_ABBR_MAP = {abbr.lower(): f'[{display_text}]' for abbr, display_text in _ABBREVIATIONS}
+
+# Класи літер для меж слів задаються один раз і підставляються в усі альтернативи
+_CYR_LETTERS = 'а-яіїєґА-ЯІЇЄҐ'
+_CYR_BOUND = f'(?<![{_CYR_LETTERS}])'
+_CYR_BOUND_AFTER = f'(?![{_CYR_LETTERS}])'
+_WORD_BOUND = f'(?<![{_CYR_LETTERS}A-Za-z])'
+_WORD_BOUND_AFTER = f'(?![{_CYR_LETTERS}A-Za-z])'
+
+# Кирилічні абревіатури можуть іти впритул одна за одною, і колишні окремі проходи
+# (по одному на абревіатуру, у порядку _ABBREVIATIONS) тегували першу лише тоді, коли
+# наступна вже стала [..] раніше за неї. Приклади (статті Gothamite, luff, some,
+# bug-hunter, splendacious):
+#   "амер.жарт." -> "[амер.][жарт.]"    "розм.жарт." -> "розм.[жарт.]"
+# Тому після крапки межею є й початок наступної абревіатури, а остаточно
+# рішення приймає _abbr_chain_tagged
+_ABBR_CYR_ALT = '|'.join(re.escape(abbr) for abbr in _ABBR_CYRILLIC)
+_ABBR_CYR_BOUND_AFTER = f'(?:{_WORD_BOUND_AFTER}|(?<=\\.)(?={_ABBR_CYR_ALT}))'
+_ABBR_CYR_START_RE = re.compile(_ABBR_CYR_ALT, re.IGNORECASE)
+_ABBR_CYR_AT_RE = re.compile(f'(?:{_ABBR_CYR_ALT}){_ABBR_CYR_BOUND_AFTER}', re.IGNORECASE)
+_ABBR_CYR_RANK = {abbr.lower(): rank for rank, abbr in enumerate(_ABBR_CYRILLIC)}
+
+
+def _abbr_chain_tagged(text: str, pos: int, rank: int) -> bool:
+    """
+    Чи стала б абревіатура, що починається з pos, тегом [..] раніше за абревіатуру з номером rank.
+
+    Відтворює порядок колишніх окремих проходів для абревіатур, що йдуть впритул.
+
+    Args:
+        text (str): Текст, що обробляється.
+        pos (int): Позиція одразу після попередньої абревіатури.
+        rank (int): Номер попередньої абревіатури в _ABBR_CYRILLIC.
+
+    Returns:
+        bool: True якщо межею для попередньої абревіатури є вже поставлена '['.
+    """
+    match = _ABBR_CYR_AT_RE.match(text, pos)
+    if match is None:
+        return False
+    next_rank = _ABBR_CYR_RANK[match.group().lower()]
+    if next_rank >= rank:
+        return False
+    end = match.end()
+    if _ABBR_CYR_START_RE.match(text, end):
+        return _abbr_chain_tagged(text, end, next_rank)
+    return True
+
+_POS_WORDS = r'noun|verb|adj(?:ective)?|adv(?:erb)?|prep(?:osition)?|conj(?:unction)?|pron(?:oun)?|int(?:erjection)?|num(?:eral)?|n|v'
+_POS_RE = re.compile(r'(\d+\.\s*)?\b(' + _POS_WORDS + r')\b(?:\s+|(?=\s))', re.IGNORECASE)
+
+
+# Заголовок за першими трьома літерами форми частини мови (noun -> 'nou', adjective -> 'adj')
+_POS3 = {
+    'n': 'NOUN', 'nou': 'NOUN',
+    'v': 'VERB', 'ver': 'VERB',
+    'adj': 'ADJECTIVE',
+    'adv': 'ADVERB',
+    'pre': 'PREPOSITION',
+    'con': 'CONJUNCTION',
+    'pro': 'PRONOUN',
+    'int': 'INTERJECTION',
+    'num': 'NUMERAL',
+}
+
+
+def _pos_header(pos: str) -> str:
+    """Повертає заголовок частини мови у форматі '[ NOUN ]' з відступами."""
+    pos = pos.lower()
+    header = _POS3.get(pos[:3]) or POS_HEADERS.get(pos, pos.upper())
+    return f'\n\n[ {header} ]\n   '
+
+
+# Готові заміни для кожної форми, яку може зловити _POS_WORDS: колбек робить
+# лише пошук у словнику замість ланцюжка порівнянь у _pos_header
+_POS_REPL = {
+    pos: _pos_header(pos)
+    for pos in (
+        'n', 'noun', 'v', 'verb', 'adj', 'adjective', 'adv', 'adverb',
+        'prep', 'preposition', 'conj', 'conjunction', 'pron', 'pronoun',
+        'int', 'interjection', 'num', 'numeral',
+    )
+}
+
+# Заголовок phrasal verb раніше ще раз проходив заміну частин мови (VERB -> [ VERB ]),
+# тому готова заміна обчислюється тим самим шляхом, щоб вивід не змінився
+_PHRASAL_REPL = _POS_RE.sub(
+    lambda m: _pos_header(m.group(2)),
+    f'\n\n{POS_HEADERS.get("phrasal v", "PHRASAL VERB")}\n   '
+)
+
+# Колишній прохід частин мови поглинав пробіли разом з порожніми рядками, що
+# лишала перед собою заміна phrasal v. Тому після частини мови або попереднього
+# phrasal v (він закінчується на VERB) заголовок іде без порожнього рядка
+_PHRASAL_BODY = _PHRASAL_REPL.lstrip('\n')
+_PHRASAL_MARK = r'(?:\d+\.\s*)?(?:phrasal\s+v|ph\.?\s*v)\b\s*'
+_PHRASAL_MARK_RE = re.compile(_PHRASAL_MARK, re.IGNORECASE)
+
+# Повні форми для скорочень (за назвою групи в _TOKEN_RE)
+_EXPANSIONS = {
+    'tzh': 'також',
+    'napr': 'наприклад',
+    'tp': 'і тому подібне',
+    'td': 'і так далі',
+    'etc': 'тощо',
+}
+
+# Порядок альтернатив відповідає порядку колишніх окремих проходів
+_TOKEN_RE = re.compile(
+    r'(?P<tzh>' + _CYR_BOUND + r'тж' + _CYR_BOUND_AFTER + r')'
+    r'|(?P<napr>' + _CYR_BOUND + r'напр\.' + _CYR_BOUND_AFTER + r')'
+    r'|(?P<tp>і т\.п\.)'
+    r'|(?P<td>і т\.д\.)'
+    r'|(?P<etc>\betc\.\b)'
+    r'|' + _WORD_BOUND + r'(?P<abbr_cyr>' + _ABBR_CYR_ALT + r')' + _ABBR_CYR_BOUND_AFTER +
+    r'|\b(?P<abbr_lat>' + '|'.join(re.escape(abbr) for abbr in _ABBR_LATIN) + r')\b'
+    r'|(?P<phrasal>(?:' + _PHRASAL_MARK + r')+)'
+    r'|(?P<pos>(?:\d+\.\s*)?\b(?P<pos_word>' + _POS_WORDS + r')'
+    r'(?:\s*(?P<pos_phrasal>(?:' + _PHRASAL_MARK + r')+)|\b(?:\s+|(?=\s))))',
+    re.IGNORECASE
+)
+
+
+def _replace_token(match: re.Match) -> str:
+    """Колбек _TOKEN_RE: обирає заміну за назвою групи, що спрацювала."""
+    kind = match.lastgroup
+    if kind == 'abbr_cyr':
+        abbr = match.group(kind)
+        end = match.end()
+        # Впритул перед іншою абревіатурою - як у колишніх окремих проходах
+        if (_ABBR_CYR_START_RE.match(match.string, end)
+                and not _abbr_chain_tagged(match.string, end, _ABBR_CYR_RANK[abbr.lower()])):
+            return abbr
+        return _ABBR_MAP[abbr.lower()]
+    if kind == 'abbr_lat':
+        # Обгортаємо абревіатуру в [аббр.] для візуального виділення
+        return _ABBR_MAP[match.group(kind).lower()]
+    if kind == 'pos':
+        repl = _POS_REPL[match.group('pos_word').lower()]
+        phrasal = match.group('pos_phrasal')
+        if phrasal is None:
+            return repl
+        # phrasal v одразу після частини мови - без порожнього рядка
+        return repl + _PHRASAL_BODY * len(_PHRASAL_MARK_RE.findall(phrasal))
+    if kind == 'phrasal':
+        # Кожен наступний phrasal v поспіль - теж без порожнього рядка
+        count = len(_PHRASAL_MARK_RE.findall(match.group(kind)))
+        return _PHRASAL_REPL + _PHRASAL_BODY * (count - 1)
+    return _EXPANSIONS[kind]
+
+
+def _pipe_group_repl(m: re.Match) -> str:
+    """Колбек _PIPE_GROUP_RE: (a|b) -> ' (a / b)'."""
+    inner = m.group(1)
+    parts = [p.strip() for p in inner.split('|') if p.strip()]
+    # prefer alphabetic token if present (likely a headword), otherwise join
+    alpha = [p for p in parts if _ALPHA_TOKEN_RE.match(p)]
+    if alpha:
+        return ' (' + ' / '.join(alpha) + ')'
+    return ' (' + ' / '.join(parts) + ')'
+
+
+@functools.lru_cache(maxsize=512)
 def format_and_display(raw_text: str, headword: str | None = None) -> str:
     """
     Парсинг та форматування тексту визначення зі словника.
 
+    Функція чиста, тому результат кешується: повторний показ того самого
+    слова (історія, обране) не проганяє регулярні вирази заново.
+
     Args:
         raw_text (str): Сирий текст визначення з сервера.
         headword (str|None): Якщо вказано, використовується для підстановки '~'.
@@ -228,178 +500,60 @@ def format_and_display(raw_text: str, headword: str | None = None) -> str:
     # Декодування HTML entities (&#x27; -> ', &quot; -> ")
     text = html.unescape(text)
 
+    # Кожен прохід нижче запускається лише якщо в тексті є його маркер (як html.unescape
+    # з '&'): короткі визначення без розмітки не сканюються зайвий раз
+
     # --- NEW: розкриваємо посилання <<word>> -> word, прибираємо стрічки початкові '>' та обробляємо (a|b) групи ---
     # Заміна посилань виду <<word>> на просто word
-    text = re.sub(r'<<\s*([^<>]+?)\s*>>', r'\1', text)
+    if '<<' in text:
+        text = _LINK_RE.sub(r'\1', text)
 
     # Прибрати початкові '>' в цитатах
-    text = re.sub(r'(?m)^\s*>+\s*', '', text)
-
-    def _pipe_group_repl(m):
-        inner = m.group(1)
-        parts = [p.strip() for p in inner.split('|') if p.strip()]
-        # prefer alphabetic token if present (likely a headword), otherwise join
-        alpha = [p for p in parts if re.match(r'^[A-Za-z\- ]+$', p)]
-        if alpha:
-            return ' (' + ' / '.join(alpha) + ')'
-        return ' (' + ' / '.join(parts) + ')'
+    if '>' in text:
+        text = _QUOTE_GT_RE.sub('', text)
 
-    text = re.sub(r'\(([^()]*\|[^()]*)\)', _pipe_group_repl, text)
+    if '|' in text:
+        text = _PIPE_GROUP_RE.sub(_pipe_group_repl, text)
 
     # Якщо є headword - підставляємо тильду (~) на його нижній регістр
-    if headword:
+    if headword and '~' in text:
         hw = headword.strip().lower()
         # Замінимо всі варіанти: '~', ' ~', '~ ', ' ~ ' - просто заміна символьна
         text = text.replace('~', hw)
 
     # Очищення від HTML тегів
-    text = re.sub(r'<[^>]+>', '', text)
+    if '<' in text:
+        text = _HTML_TAG_RE.sub('', text)
     # Видаляємо DSL/технічні блоки типу [m1], [c], але НЕ заголовки POS типу [ NOUN ]
-    text = re.sub(r'\[(?![ ]*(NOUN|VERB|ADJECTIVE|ADVERB|PREPOSITION|CONJUNCTION|PRONOUN|INTERJECTION|NUMERAL|PHRASAL VERB)[ ]*\])[^]]*\]', '', text)
-    text = text.replace('\\n', '\n').replace('\r\n', '\n').replace('\r', '\n')
-
-    # --- Нові правила очищення / тегування ---
-    # Повний список абревіатур, які зустрічаються в словниках
-    # ВАЖЛИВО: \b не працює з кирилицею, тому використовуємо (?:^|[^а-яіїєґА-ЯІЇЄҐ])
-    # Формат: (regex_pattern, display_text)
-
-    # Функція для створення regex-патерну для кирилічних абревіатур
-    def _cyrillic_word_pattern(abbr: str) -> str:
-        """Створює regex для кирилічної абревіатури з правильними межами слів."""
-        # Екрануємо крапку якщо є
-        escaped = re.escape(abbr)
-        # Межа: початок рядка або не-кирилічний символ
-        return r'(?:^|(?<=[^а-яіїєґА-ЯІЇЄҐA-Za-z]))' + escaped + r'(?=[^а-яіїєґА-ЯІЇЄҐA-Za-z]|$)'
-
-    ABBREVIATIONS = [
-        # Стилістичні позначки
-        (_cyrillic_word_pattern('розм.'), 'розм.'),       # розмовне
-        (_cyrillic_word_pattern('книжк.'), 'книжк.'),     # книжне
-        (_cyrillic_word_pattern('поет.'), 'поет.'),       # поетичне
-        (_cyrillic_word_pattern('жарт.'), 'жарт.'),       # жартівливе
-        (_cyrillic_word_pattern('ірон.'), 'ірон.'),       # іронічне
-        (_cyrillic_word_pattern('зневажл.'), 'зневажл.'), # зневажливе
-        (_cyrillic_word_pattern('вульг.'), 'вульг.'),     # вульгарне
-        (_cyrillic_word_pattern('прост.'), 'прост.'),     # просторічне
-        (_cyrillic_word_pattern('діал.'), 'діал.'),       # діалектне
-        (_cyrillic_word_pattern('застар.'), 'застар.'),   # застаріле
-        (_cyrillic_word_pattern('рідко'), 'рідко'),        # рідковживане
-
-        # Галузеві позначки
-        (_cyrillic_word_pattern('мор.'), 'мор.'),         # морський термін
-        (_cyrillic_word_pattern('військ.'), 'військ.'),   # військовий
-        (_cyrillic_word_pattern('зоол.'), 'зоол.'),       # зоологія
-        (_cyrillic_word_pattern('бот.'), 'бот.'),         # ботаніка
-        (_cyrillic_word_pattern('мед.'), 'мед.'),         # медицина
-        (_cyrillic_word_pattern('юр.'), 'юр.'),           # юридичний
-        (_cyrillic_word_pattern('тех.'), 'тех.'),         # технічний
-        (_cyrillic_word_pattern('фіз.'), 'фіз.'),         # фізика
-        (_cyrillic_word_pattern('хім.'), 'хім.'),         # хімія
-        (_cyrillic_word_pattern('матем.'), 'матем.'),     # математика
-        (_cyrillic_word_pattern('муз.'), 'муз.'),         # музика
-        (_cyrillic_word_pattern('спорт.'), 'спорт.'),     # спорт
-        (_cyrillic_word_pattern('авіа.'), 'авіа.'),       # авіація
-        (_cyrillic_word_pattern('ел.'), 'ел.'),           # електрика
-        (_cyrillic_word_pattern('рел.'), 'рел.'),         # релігія
-        (_cyrillic_word_pattern('біол.'), 'біол.'),       # біологія
-        (_cyrillic_word_pattern('геол.'), 'геол.'),       # геологія
-        (_cyrillic_word_pattern('екон.'), 'екон.'),       # економіка
-        (_cyrillic_word_pattern('політ.'), 'політ.'),     # політика
-
-        # Географічні позначки
-        (_cyrillic_word_pattern('амер.'), 'амер.'),       # американізм
-        (_cyrillic_word_pattern('брит.'), 'брит.'),       # британізм
-        (_cyrillic_word_pattern('шотл.'), 'шотл.'),       # шотландізм
-        (_cyrillic_word_pattern('австрал.'), 'австрал.'), # австралійський
-
-        # Граматичні позначки (латинські - використовують \b)
-        (r'\bpl\b', 'мн.'),             # множина (plural)
-        (r'\bsg\b', 'одн.'),            # однина (singular)
-        (_cyrillic_word_pattern('перен.'), 'перен.'),     # переносне значення
-        (_cyrillic_word_pattern('букв.'), 'букв.'),       # буквально
-        (_cyrillic_word_pattern('збірн.'), 'збірн.'),     # збірне
-        (_cyrillic_word_pattern('скор.'), 'скор.'),       # скорочення
-        (r'\battr\b', 'означ.'),        # attributive / означальне
-        (r'\bpred\b', 'присуд.'),       # predicative / присудкове
-    ]
-
-    # Заміна 'тж' на 'також' перед тегуванням (з правильними межами для кирилиці)
-    text = re.sub(r'(?:^|(?<=[^а-яіїєґА-ЯІЇЄҐ]))тж(?=[^а-яіїєґА-ЯІЇЄҐ]|$)', 'також', text, flags=re.IGNORECASE)
-
-    # Заміна 'напр.' на 'наприклад'
-    text = re.sub(r'(?:^|(?<=[^а-яіїєґА-ЯІЇЄҐ]))напр\.(?=[^а-яіїєґА-ЯІЇЄҐ]|$)', 'наприклад', text, flags=re.IGNORECASE)
-
-    # Заміна 'і т.п.' / 'і т.д.' / 'etc.' на повні форми
-    text = re.sub(r'і т\.п\.', 'і тому подібне', text, flags=re.IGNORECASE)
-    text = re.sub(r'і т\.д\.', 'і так далі', text, flags=re.IGNORECASE)
-    text = re.sub(r'\betc\.\b', 'тощо', text, flags=re.IGNORECASE)
-
-    # Обернемо знайдені абревіатури в [аббр.] для візуального виділення
-    def _tag_abbr(abbr_text: str) -> str:
-        """Обгортає абревіатуру в квадратні дужки для візуального виділення."""
-        return f'[{abbr_text}]'
-
-    # Застосуємо для всіх абревіатур зі списку
-    for pattern, display_text in ABBREVIATIONS:
-        text = re.sub(pattern, _tag_abbr(display_text), text, flags=re.IGNORECASE)
-
-    # Заміна phrasal verbs
-    text = re.sub(
-        r'(\d+\.\s*)?(phrasal\s+v|ph\.?\s*v)\b\s*',
-        lambda m: f'\n\n{POS_HEADERS.get("phrasal v", "PHRASAL VERB")}\n   ',
-        text,
-        flags=re.IGNORECASE
-    )
-
-    # Заміна частин мови
-    pos_pattern = r'(\d+\.\s*)?\b(noun|verb|adj(?:ective)?|adv(?:erb)?|prep(?:osition)?|conj(?:unction)?|pron(?:oun)?|int(?:erjection)?|num(?:eral)?|n|v)\b(?:\s+|(?=\s))'
-
-    def replace_pos(match):
-        pos = match.group(2).lower()
-        if pos in ['n', 'noun']:
-            key = 'n'
-        elif pos in ['v', 'verb']:
-            key = 'v'
-        elif pos.startswith('adj'):
-            key = 'adj'
-        elif pos.startswith('adv'):
-            key = 'adv'
-        elif pos.startswith('prep'):
-            key = 'prep'
-        elif pos.startswith('conj'):
-            key = 'conj'
-        elif pos.startswith('pron'):
-            key = 'pron'
-        elif pos.startswith('int'):
-            key = 'int'
-        elif pos.startswith('num'):
-            key = 'num'
-        else:
-            key = pos
-        header = POS_HEADERS.get(key, pos.upper())
-        return f'\n\n[ {header} ]\n   '
-
-    text = re.sub(pos_pattern, replace_pos, text, flags=re.IGNORECASE)
-    text = re.sub(r'^\s*\d+\.\s*', '', text, flags=re.MULTILINE)
-
-    # Форматування відступів
-    lines = text.split('\n')
+    if '[' in text:
+        text = _DSL_BLOCK_RE.sub('', text)
+    if '\\' in text or '\r' in text:
+        text = text.replace('\\n', '\n').replace('\r\n', '\n').replace('\r', '\n')
+
+    # Один прохід замість окремого на кожне правило: 'тж' -> 'також', 'напр.' -> 'наприклад',
+    # 'і т.п.' / 'і т.д.' / 'etc.' -> повні форми, абревіатури -> [аббр.],
+    # phrasal verbs та частини мови -> заголовки [ NOUN ]
+    text = _TOKEN_RE.sub(_replace_token, text)
+    text = _NUM_PREFIX_RE.sub('', text)
+
+    # Форматування відступів: порожні рядки стискаються до одного (і не йдуть першими),
+    # заголовки [ NOUN ] лишаються як є, решта отримує відступ
     formatted_lines = []
-    for line in lines:
+    append = formatted_lines.append
+    prev_blank = True
+    for line in text.split('\n'):
         stripped = line.strip()
         if not stripped:
-            if formatted_lines and formatted_lines[-1] != '':
-                formatted_lines.append('')
+            if not prev_blank:
+                append('')
+                prev_blank = True
             continue
-        # Перевіряємо чи це заголовок частини мови (формат: [ NOUN ])
-        is_header = stripped.startswith('[') and stripped.endswith(']')
-        if is_header:
-            formatted_lines.append(stripped)
+        prev_blank = False
+        # Заголовок частини мови (формат: [ NOUN ]); після strip() рядок не починається з пробілу
+        if stripped[0] == '[' and stripped[-1] == ']':
+            append(stripped)
         else:
-            if not stripped.startswith('   '):
-                formatted_lines.append(f'   {stripped}')
-            else:
-                formatted_lines.append(stripped)
+            append('   ' + stripped)
 
     # Повертаємо готовий текст
     return '\n'.join(formatted_lines)
@@ -473,6 +627,48 @@ KNOWN_ABBREVIATIONS = {
 
 
 
+# --- Очищення тексту для копіювання (ResultCard та слово дня) ---
+_POS_STRIP_RE = re.compile(r'\[\s*(NOUN|VERB|ADJECTIVE|ADVERB|PREPOSITION|CONJUNCTION|PRONOUN|INTERJECTION|NUMERAL|PHRASAL VERB)\s*\]')
+_TRIPLE_NL_RE = re.compile(r'\n{3,}')
+_LEADING_SPACES_RE = re.compile(r'^\s+', re.MULTILINE)
+
+
+def _clean_text_for_copy(text: str, headword: str | None = None) -> str:
+    """
+    Прибирає з визначення заголовки POS, headword на початку та зайві пробіли.
+
+    Args:
+        text: Відформатований текст визначення.
+        headword: Слово-заголовок, яке треба прибрати з початку тексту.
+
+    Returns:
+        str: Чистий текст перекладу для копіювання.
+    """
+    # Видаляємо заголовки частин мови типу [ NOUN ], [ VERB ] тощо
+    text = _POS_STRIP_RE.sub('', text)
+
+    # Видаляємо headword на початку (можливо з пробілами та переносами) - без regex
+    if headword:
+        stripped = text.lstrip()
+        if stripped[:len(headword)].lower() == headword.lower():
+            text = stripped[len(headword):].lstrip()
+
+    # Очищаємо зайві переноси рядків та пробіли
+    text = _TRIPLE_NL_RE.sub('\n\n', text)  # Макс 2 переноси
+    text = _LEADING_SPACES_RE.sub('', text)  # Видаляємо пробіли на початку рядків
+    return text.strip()
+
+
+# Рядок визначення з номером: "1. ..." або "1) ..."
+_DEFINITION_SPLIT_RE = re.compile(r'^(\d+[.)])\s*(.*)$')
+
+# Скільки рядків картки рендерити одразу і скільки - за одну відкладену порцію
+RESULT_CARD_HEAD_LINES = 15
+RESULT_CARD_CHUNK_LINES = 10
+# Скільки прихованих карток тримати для повторного використання між пошуками
+RESULT_CARD_POOL_SIZE = 2
+
+
 class ResultCard(ctk.CTkFrame):
     """
     Картка результату перекладу (English → Ukrainian).
@@ -570,158 +766,204 @@ class ResultCard(ctk.CTkFrame):
         separator = ctk.CTkFrame(main_container, fg_color=COLORS["border"], height=1)
         separator.pack(fill="x", pady=(0, 0))  # Minimal padding
 
-        # === CONTENT: Regular Frame для визначень ===
-        self.content_frame = ctk.CTkFrame(
+        # === CONTENT: один текстовий віджет з тегами замість дерева фреймів/лейблів ===
+        self.textbox = ctk.CTkTextbox(
             main_container,
             fg_color="transparent",
-            corner_radius=0
+            text_color=COLORS["text_secondary"],
+            font=("Segoe UI", 12),
+            wrap="word",
+            border_width=0,
+            corner_radius=0,
+            activate_scrollbars=False,
+            height=1
         )
-        self.content_frame.pack(fill="both", expand=True, pady=(0, 20))  # Start immediately below title
+        self.textbox.pack(fill="both", expand=True, pady=(0, 20))  # Start immediately below title
+
+        # Внутрішній tkinter Text: CTkTextbox забороняє font у tag_config
+        self._text = self.textbox._textbox
+        self._configure_tags()
+        self._text_height = 0
+        # Перенесення рядків залежить від ширини, тому висоту перераховуємо при її зміні
+        self._text.bind("<Configure>", self._fit_height, add="+")
+        # Запланована порція рендерингу (скасовується при повторному використанні картки)
+        self._chunk_job = None
 
         # Парсимо та відображаємо
         self._parse_and_render(self.definition)
 
+    def reconfigure(self, headword, definition, is_favorite=False):
+        """
+        Показати в цій картці інше слово (повторне використання замість нової картки).
+
+        Args:
+            headword: Англійське слово (заголовок)
+            definition: Українське визначення
+            is_favorite: Стан улюбленого
+        """
+        headword = html.unescape(headword).strip()
+        definition = html.unescape(definition)
+        self.is_favorite = is_favorite
+        if self.favorite_callback:
+            self._update_star()
+
+        # Те саме слово, що вже показано в картці - текст не перебудовуємо
+        if headword == self.headword and definition == self.definition:
+            return
+
+        self.headword = headword
+        self.definition = definition
+        self.word_label.configure(text=self.headword.title() if self.headword else "Result")
+
+        self._text.configure(state="normal")
+        self._text.delete("1.0", "end")
+        self._text.configure(state="disabled")
+        self._parse_and_render(self.definition)
+
+    def _configure_tags(self):
+        """Налаштовує теги стилів рядків (аналог колишніх окремих віджетів)."""
+        text = self._text
+        text.tag_config("spacer", font=("Segoe UI", 4))
+        text.tag_config("pos_header", font=("Segoe UI", 14, "bold"), foreground="#10B981",
+                        spacing1=12, spacing3=6)
+        text.tag_config("definition", spacing1=4, spacing3=4, lmargin2=35)
+        text.tag_config("definition_number", font=("Segoe UI", 14, "bold"), foreground="#3B82F6")
+        text.tag_config("definition_text", font=("Segoe UI", 16), foreground=COLORS["text_primary"])
+        text.tag_config("example", spacing1=2, spacing3=2, lmargin1=35, lmargin2=35)
+        text.tag_config("example_en", font=("Segoe UI", 12, "italic"), foreground="#60A5FA")
+        text.tag_config("example_dash", font=("Segoe UI", 12), foreground=COLORS["text_muted"])
+        text.tag_config("example_ukr", font=("Segoe UI", 15), foreground=COLORS["text_secondary"])  # EX: Example text (Ukrainian part)
+        text.tag_config("example_note", font=("Segoe UI", 15, "italic"), foreground=COLORS["text_secondary"])  # EX: Example text
+        text.tag_config("regular", spacing1=2, spacing3=2)
+
     def _parse_and_render(self, text):
-        """Smart Parser: розбирає текст та створює структуровані віджети."""
+        """
+        Smart Parser: розбирає текст та вставляє його у віджет.
+
+        Перший екран рядків рендериться одразу, решта - порціями через
+        after_idle, щоб довгі визначення не блокували появу картки.
+        """
         lines = text.split('\n')
+        # Теги перенесення рядка, відкладеного до наступної порції
+        self._pending_newline = None
+        # Порції попереднього слова (якщо картку використано повторно) більше не потрібні
+        if self._chunk_job is not None:
+            self.after_cancel(self._chunk_job)
+            self._chunk_job = None
+
+        self._render_lines(lines[:RESULT_CARD_HEAD_LINES])
+        if len(lines) > RESULT_CARD_HEAD_LINES:
+            self._chunk_job = self.after_idle(self._render_chunk, lines, RESULT_CARD_HEAD_LINES)
+
+    def _render_chunk(self, lines, start):
+        """Рендерить наступну порцію рядків і планує наступну, поки рядки не скінчаться."""
+        try:
+            if not self.winfo_exists():
+                return
+        except Exception:
+            # Картку вже знищено (новий пошук очистив результати)
+            return
+
+        end = start + RESULT_CARD_CHUNK_LINES
+        self._render_lines(lines[start:end])
+        if end < len(lines):
+            self._chunk_job = self.after_idle(self._render_chunk, lines, end)
+        else:
+            self._chunk_job = None
+
+    def _render_lines(self, lines):
+        """Вставляє рядки у віджет одним викликом та оновлює висоту."""
+        segments = []
+        if self._pending_newline is not None:
+            segments.append(("\n", self._pending_newline))
+            self._pending_newline = None
 
         for line in lines:
             stripped = line.strip()
             if not stripped:
-                spacer = ctk.CTkFrame(self.content_frame, fg_color="transparent", height=8)
-                spacer.pack(fill="x")
+                segments.append(("\n", ("spacer",)))
                 continue
-
-            line_type = self._classify_line(stripped)
-
-            if line_type == "pos_header":
-                self._render_pos_header(stripped)
-            elif line_type == "definition":
-                self._render_definition(stripped)
-            elif line_type == "example":
-                self._render_example(stripped)
-            else:
-                self._render_regular(stripped)
+            segments.extend(self._line_segments(stripped))
+
+        if segments:
+            # Останній перенос відкладаємо: Text сам додає порожній рядок у кінці,
+            # а наступна порція вставить його першим
+            last_text, last_tags = segments[-1]
+            segments[-1] = (last_text[:-1], last_tags)
+            self._pending_newline = last_tags
+
+        args = []
+        for chunk, tags in segments:
+            args.append(chunk)
+            args.append(tags)
+
+        self._text.configure(state="normal")
+        if args:
+            self._text.insert("end", *args)
+        self._text.configure(state="disabled")
+        self._fit_height()
 
     def _classify_line(self, line):
         """Класифікує рядок за типом."""
         if line.startswith('[') and line.endswith(']'):
             return "pos_header"
-        if re.match(r'^\d+[.)]\s', line):
-            return "definition"
+        # Номер визначення "1. " / "12) " - перевірка символами замість re.match
+        if line[:1].isdecimal():
+            i = 1
+            while line[i:i + 1].isdecimal():
+                i += 1
+            if line[i:i + 1] in ('.', ')') and line[i + 1:i + 2].isspace():
+                return "definition"
         if line.startswith('~') or line.startswith('-') or ' — ' in line or line.startswith('   '):
             return "example"
         return "regular"
 
-    def _render_pos_header(self, text):
-        """Рендеринг заголовка частини мови."""
-        pos_text = text.strip('[]').strip()
-
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        header_frame.pack(fill="x", pady=(12, 6))
-
-        accent_line = ctk.CTkFrame(header_frame, fg_color="#10B981", width=4, height=20)
-        accent_line.pack(side="left", padx=(0, 10))
-
-        ctk.CTkLabel(
-            header_frame,
-            text=pos_text,
-            font=("Segoe UI", 14, "bold"),
-            text_color="#10B981",
-            anchor="w"
-        ).pack(side="left")
-
-    def _render_definition(self, text):
-        """Рендеринг визначення з номером."""
-        def_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        def_frame.pack(fill="x", pady=4)
+    def _line_segments(self, line):
+        """
+        Повертає сегменти (текст, теги) для одного непорожнього рядка.
 
-        match = re.match(r'^(\d+[.)])\s*(.*)$', text)
-        if match:
-            number = match.group(1)
-            rest = match.group(2)
-        else:
-            number = ""
-            rest = text
-
-        if number:
-            ctk.CTkLabel(
-                def_frame,
-                text=number,
-                font=("Segoe UI", 14, "bold"),
-                text_color="#3B82F6",
-                width=35,
-                anchor="w"
-            ).pack(side="left")
+        Args:
+            line: Рядок без пробілів на краях.
 
-        ctk.CTkLabel(
-            def_frame,
-            text=rest,
-            font=("Segoe UI", 16),
-            text_color=COLORS["text_primary"],
-            anchor="w",
-            wraplength=550,
-            justify="left"
-        ).pack(side="left", fill="x", expand=True)
-
-    def _render_example(self, text):
-        """Рендеринг прикладу (indented, italic)."""
-        example_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        example_frame.pack(fill="x", pady=2, padx=(35, 0))
-
-        if ' — ' in text:
-            parts = text.split(' — ', 1)
-            english_part = parts[0].strip().lstrip('~- ')
-            ukr_part = parts[1].strip() if len(parts) > 1 else ""
-
-            ctk.CTkLabel(
-                example_frame,
-                text=english_part,
-                font=("Segoe UI", 12, "italic"),
-                text_color="#60A5FA",
-                anchor="w"
-            ).pack(side="left")
-
-            ctk.CTkLabel(
-                example_frame,
-                text=" — ",
-                font=("Segoe UI", 12),
-                text_color=COLORS["text_muted"],
-                anchor="w"
-            ).pack(side="left")
-
-            ctk.CTkLabel(
-                example_frame,
-                text=ukr_part,
-                font=("Segoe UI", 15),  # EX: Example text (Ukrainian part)
-                text_color=COLORS["text_secondary"],
-                anchor="w",
-                wraplength=450,
-                justify="left"
-            ).pack(side="left", fill="x", expand=True)
-        else:
-            display_text = text.lstrip('~- ').strip()
-            ctk.CTkLabel(
-                example_frame,
-                text=f"→ {display_text}",
-                font=("Segoe UI", 15, "italic"),  # EX: Example text
-                text_color=COLORS["text_secondary"],
-                anchor="w",
-                wraplength=500,
-                justify="left"
-            ).pack(side="left", fill="x", expand=True)
-
-    def _render_regular(self, text):
-        """Рендеринг звичайного тексту."""
-        ctk.CTkLabel(
-            self.content_frame,
-            text=text,
-            font=("Segoe UI", 12),
-            text_color=COLORS["text_secondary"],
-            anchor="w",
-            wraplength=550,
-            justify="left"
-        ).pack(fill="x", pady=2)
+        Returns:
+            list: Пари (текст, кортеж тегів); останній сегмент закінчується '\n'.
+        """
+        line_type = self._classify_line(line)
+
+        if line_type == "pos_header":
+            return [(f"▍ {line.strip('[]').strip()}\n", ("pos_header",))]
+
+        if line_type == "definition":
+            number, rest = _DEFINITION_SPLIT_RE.match(line).groups()
+            return [
+                (f"{number} ", ("definition", "definition_number")),
+                (f"{rest}\n", ("definition", "definition_text")),
+            ]
+
+        if line_type == "example":
+            # partition: один прохід замість перевірки "in" та split
+            english_part, sep, ukr_part = line.partition(' — ')
+            if sep:
+                return [
+                    (english_part.strip().lstrip('~- '), ("example", "example_en")),
+                    (" — ", ("example", "example_dash")),
+                    (f"{ukr_part.strip()}\n", ("example", "example_ukr")),
+                ]
+            return [(f"→ {line.lstrip('~- ').strip()}\n", ("example", "example_note"))]
+
+        return [(f"{line}\n", ("regular",))]
+
+    def _fit_height(self, event=None):
+        """Підганяє висоту віджета під вміст, щоб картка не мала власного скролу."""
+        try:
+            pixels = self._text.count("1.0", "end", "update", "ypixels")
+        except Exception:
+            return
+        if isinstance(pixels, tuple):
+            pixels = pixels[0]
+        if pixels and pixels != self._text_height:
+            self._text_height = pixels
+            self.textbox.configure(height=pixels + 4)
 
     def _copy_to_clipboard(self):
         """Копіювання ТІЛЬКИ тексту перекладу (без headword та заголовків POS)."""
@@ -744,23 +986,7 @@ class ResultCard(ctk.CTkFrame):
         Returns:
             str: Чистий текст перекладу для копіювання.
         """
-        text = self.definition
-
-        # Видаляємо заголовки частин мови типу [ NOUN ], [ VERB ] тощо
-        text = re.sub(r'\[\s*(NOUN|VERB|ADJECTIVE|ADVERB|PREPOSITION|CONJUNCTION|PRONOUN|INTERJECTION|NUMERAL|PHRASAL VERB)\s*\]', '', text)
-
-        # Видаляємо headword якщо він на початку рядка
-        if self.headword:
-            # Видаляємо headword на початку (можливо з пробілами та переносами)
-            pattern = rf'^\s*{re.escape(self.headword)}\s*\n?'
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-
-        # Очищаємо зайві переноси рядків та пробіли
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Макс 2 переноси
-        text = re.sub(r'^\s+', '', text, flags=re.MULTILINE)  # Видаляємо пробіли на початку рядків
-        text = text.strip()
-
-        return text
+        return _clean_text_for_copy(self.definition, self.headword)
 
     def _toggle_favorite(self):
         """Toggle favorite status for this word."""
@@ -771,15 +997,19 @@ class ResultCard(ctk.CTkFrame):
         self.is_favorite = not self.is_favorite
         
         # Update visual state immediately
+        self._update_star()
+        
+        # Call the callback with word, definition, and new favorite status
+        # This will update the database
+        self.favorite_callback(self.headword, self.definition, self.is_favorite)
+
+    def _update_star(self):
+        """Оновити вигляд зірки відповідно до is_favorite."""
         star_text = "⭐" if self.is_favorite else "☆"
         self.star_btn.configure(
             text=star_text,
             text_color="#FFD700" if self.is_favorite else COLORS["text_muted"]
         )
-        
-        # Call the callback with word, definition, and new favorite status
-        # This will update the database
-        self.favorite_callback(self.headword, self.definition, self.is_favorite)
 
 
 class HistoryItem(ctk.CTkButton):
@@ -799,6 +1029,197 @@ class HistoryItem(ctk.CTkButton):
         )
 
 
+class VirtualWordList(ctk.CTkFrame):
+    """
+    Віртуалізований список слів з кнопками видалення (History / Favorites).
+
+    Рядки малюються на CTkCanvas: віджети створюються лише для видимої
+    області (плюс запас) і перевикористовуються під час прокрутки - змінюється
+    текст і позиція, а не створюються нові кнопки на кожне слово.
+    """
+
+    # Висота рядка: кнопка 38 px + pady 3 зверху й знизу
+    ROW_HEIGHT = 44
+    # Скільки рядків тримати поза видимою областю з кожного боку
+    OVERSCAN = 2
+
+    def __init__(self, master, icon: str, empty_text: str, on_select, on_delete, **kwargs):
+        """
+        Args:
+            master: Батьківський віджет.
+            icon: Іконка перед словом (🕒 / ⭐).
+            empty_text: Текст, що показується для порожнього списку.
+            on_select: Callback(word) при кліку на слово.
+            on_delete: Callback(word) при кліку на ✕.
+        """
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self._icon = icon
+        self._on_select = on_select
+        self._on_delete = on_delete
+        # Висота рядка в пікселях екрана (кнопки CTk масштабуються, canvas - ні)
+        self._row_height = round(self._apply_widget_scaling(self.ROW_HEIGHT))
+        self._row_pad = round(self._apply_widget_scaling(3))
+        self._items = []
+        # Пул рядків: id вікна на canvas, кнопка слова та слово, яке вона показує
+        self._row_windows = []
+        self._row_buttons = []
+        self._row_words = []
+
+        self._canvas = ctk.CTkCanvas(
+            self, bg=COLORS["bg_main"], highlightthickness=0, borderwidth=0,
+            yscrollincrement=self._row_height
+        )
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._canvas.yview)
+        self._scrollbar.pack(side="right", fill="y")
+        self._canvas.pack(side="left", fill="both", expand=True)
+        # yscrollcommand викликається на кожну зміну видимої області (прокрутка, resize)
+        self._canvas.configure(yscrollcommand=self._on_yview)
+        self._canvas.bind("<Configure>", self._on_configure)
+        self._bind_wheel(self._canvas)
+
+        self._empty_label = ctk.CTkLabel(
+            self,
+            text=empty_text,
+            font=("Segoe UI", 13),
+            text_color=COLORS["text_muted"]
+        )
+
+    def set_items(self, items):
+        """
+        Замінити вміст списку; існуючі рядки пулу перевикористовуються.
+
+        Args:
+            items: Слова для відображення.
+        """
+        self._items = list(items)
+        self._refresh()
+
+    def remove_item(self, word: str):
+        """
+        Прибрати одне слово; перемальовуються лише видимі рядки.
+
+        Args:
+            word: Слово для видалення зі списку.
+        """
+        try:
+            self._items.remove(word)
+        except ValueError:
+            return
+        self._refresh()
+
+    def _refresh(self):
+        """Оновити область прокрутки, напис порожнього списку та видимі рядки."""
+        width = self._canvas.winfo_width()
+        self._canvas.configure(scrollregion=(0, 0, width, self._row_height * len(self._items)))
+        if self._items:
+            self._empty_label.place_forget()
+        else:
+            self._empty_label.place(relx=0.5, y=50, anchor="n")
+        self._render()
+
+    def _create_row(self):
+        """Створити рядок пулу (frame з кнопкою слова та кнопкою видалення)."""
+        slot = len(self._row_windows)
+        item_frame = ctk.CTkFrame(self._canvas, fg_color="transparent")
+
+        # Word button (clickable)
+        word_btn = ctk.CTkButton(
+            item_frame,
+            text="",
+            font=("Segoe UI", 13),
+            fg_color="transparent",
+            text_color=COLORS["text_primary"],
+            hover_color=COLORS["border"],
+            anchor="w",
+            height=38,
+            corner_radius=8,
+            command=functools.partial(self._select_row, slot)
+        )
+        word_btn.pack(side="left", fill="x", expand=True, padx=(0, 5))
+
+        # Delete button (X icon)
+        delete_btn = ctk.CTkButton(
+            item_frame,
+            text="✕",
+            width=36,
+            height=38,
+            font=("Segoe UI", 12),
+            fg_color="transparent",
+            text_color=COLORS["text_muted"],
+            hover_color=COLORS["danger"],
+            corner_radius=8,
+            command=functools.partial(self._delete_row, slot)
+        )
+        delete_btn.pack(side="right")
+
+        for widget in (item_frame, word_btn, delete_btn):
+            self._bind_wheel(widget)
+
+        window_id = self._canvas.create_window(
+            0, 0, window=item_frame, anchor="nw", width=self._canvas.winfo_width()
+        )
+        self._row_windows.append(window_id)
+        self._row_buttons.append(word_btn)
+        self._row_words.append(None)
+
+    def _select_row(self, slot: int):
+        """Клік по слову в рядку пулу slot."""
+        self._on_select(self._row_words[slot])
+
+    def _delete_row(self, slot: int):
+        """Клік по ✕ в рядку пулу slot."""
+        self._on_delete(self._row_words[slot])
+
+    def _render(self):
+        """Розставити рядки пулу на слова, що потрапляють у видиму область."""
+        top = int(self._canvas.canvasy(0))
+        height = self._canvas.winfo_height()
+        first = max(0, top // self._row_height - self.OVERSCAN)
+        last = min(len(self._items), (top + height) // self._row_height + 1 + self.OVERSCAN)
+
+        while len(self._row_windows) < last - first:
+            self._create_row()
+
+        canvas = self._canvas
+        for slot, window_id in enumerate(self._row_windows):
+            index = first + slot
+            if index >= last:
+                canvas.itemconfigure(window_id, state="hidden")
+                continue
+            word = self._items[index]
+            if word != self._row_words[slot]:
+                self._row_words[slot] = word
+                self._row_buttons[slot].configure(text=f"{self._icon} {word}")
+            canvas.coords(window_id, 0, index * self._row_height + self._row_pad)
+            canvas.itemconfigure(window_id, state="normal")
+
+    def _on_yview(self, first, last):
+        """Синхронізувати скролбар і перерахувати видимі рядки."""
+        self._scrollbar.set(first, last)
+        self._render()
+
+    def _on_configure(self, event):
+        """Розтягнути рядки на ширину canvas."""
+        for window_id in self._row_windows:
+            self._canvas.itemconfigure(window_id, width=event.width)
+        self._canvas.configure(scrollregion=(0, 0, event.width, self._row_height * len(self._items)))
+
+    def _bind_wheel(self, widget):
+        """Прокрутка колесом миші над віджетом (Windows/macOS та X11)."""
+        widget.bind("<MouseWheel>", self._on_mousewheel, add="+")
+        widget.bind("<Button-4>", self._on_mousewheel, add="+")
+        widget.bind("<Button-5>", self._on_mousewheel, add="+")
+
+    def _on_mousewheel(self, event):
+        """Прокрутити на один рядок за крок колеса."""
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        self._canvas.yview_scroll(step, "units")
+
+
+# Текстові відповіді сервера (у нижньому регістрі), що означають "не знайдено / помилка"
+_ERROR_RESPONSES = frozenset({"not found", "error", "notfound"})
+
+
 class ModernDictionaryApp(ctk.CTk):
     """
     Головне вікно застосунку з принципом "70% Golden Mean".
@@ -807,6 +1228,28 @@ class ModernDictionaryApp(ctk.CTk):
         client (DictionaryClient): Клієнт для мережевих операцій.
     """
 
+    # Теги-"чипи" діалогу додавання слова: (підпис кнопки, текст для вставки)
+    TAG_BUTTONS = (
+        ("[NOUN]", "[NOUN] "),
+        ("[VERB]", "[VERB] "),
+        ("[ADJ]", "[ADJ] "),
+        ("[ADV]", "[ADV] "),
+        ("[PHRASE]", "[PHRASE] "),
+        ("[IT]", "[IT] "),
+        ("[SCI]", "[SCI] "),
+    )
+
+    # Спільний вигляд чипів (будується один раз при завантаженні класу)
+    _CHIP_KW = dict(
+        width=60,
+        height=26,
+        font=("Segoe UI", 10),
+        fg_color="#87CEEB",  # Light blue (Sky Blue)
+        hover_color="#6BB6FF",  # Slightly darker on hover
+        text_color="#FFFFFF",
+        corner_radius=12,
+    )
+
     def __init__(self, client: DictionaryClient = None):
         super().__init__()
 
@@ -821,7 +1264,12 @@ class ModernDictionaryApp(ctk.CTk):
         self.configure(fg_color=COLORS["bg_main"])
 
         # Для drag вікна
-        self._drag_data = {"x": 0, "y": 0}
+        # Зміщення курсора відносно лівого верхнього кута вікна на початку перетягування
+        self._drag_x = 0
+        self._drag_y = 0
+        # Остання запланована позиція вікна; застосовується не частіше разу на idle-цикл
+        self._drag_geometry = None
+        self._drag_pending = False
 
         # Network client (можна передати ззовні або створити новий)
         self.network = client if client else DictionaryClient()
@@ -830,14 +1278,39 @@ class ModernDictionaryApp(ctk.CTk):
         # Database Manager для історії та налаштувань (OOP Композиція)
         # Змушуємо використовувати файлову базу для збереження історії
         self.db = DatabaseManager("dictionary_history.db")
+        # Кеш вмісту History / Favorites; скидається в None при кожному записі в ці таблиці
+        self._history_cache = None
+        self._favorites_cache = None
+        # Слова, переклад яких уже запитано й ще не показано (повторний Enter ігнорується)
+        self._inflight_translations = set()
+        # Повідомлення журналу (час, текст), що чекають на спільний вивід у консоль
+        self._log_queue = deque()
+        self._log_flush_pending = False
         self._auto_connect_attempted = False
         
         # Store current word for favorites toggle
         self.current_headword = None
         self.current_definition = None
-        
-        # Thread tracking for network operations
-        self._network_threads = []  # Список активних мережевих потоків
+
+        # Кешовані екрани (будуються при першому показі, далі лише pack/pack_forget)
+        self._start_screen_frame = None
+        self.results_container = None
+        # Приховані картки результатів для повторного використання (див. _clear_results)
+        self._result_card_pool = []
+        # Popup-и додавання слова та Saved & History (будуються при першому відкритті, далі withdraw/deiconify)
+        self._add_word_popup = None
+        self._saved_popup = None
+
+        # Один asyncio-цикл у фоновому потоці для всіх мережевих операцій
+        # (замість окремого потоку на кожен запит)
+        self._loop = asyncio.new_event_loop()
+        # Обмежений пул для блокуючих викликів (connect) замість необмеженого пулу за замовчуванням
+        self._net_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="net")
+        self._loop.set_default_executor(self._net_pool)
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="UINetworkLoop", daemon=True
+        )
+        self._loop_thread.start()
 
         # Create UI
         self._create_custom_title_bar()
@@ -853,6 +1326,20 @@ class ModernDictionaryApp(ctk.CTk):
 
         logger.info("Застосунок успішно запущено")
 
+    def _run_network(self, coro):
+        """
+        Запускає корутину в мережевому циклі застосунку.
+
+        Корутина сама передає результат в UI потік через self.after(0, ...).
+
+        Args:
+            coro: Корутина з мережевою операцією.
+
+        Returns:
+            concurrent.futures.Future: Результат корутини.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
     def _try_auto_connect(self):
         """Автоматична спроба підключення при запуску (в фоновому потоці)."""
         if self._auto_connect_attempted:
@@ -863,7 +1350,6 @@ class ModernDictionaryApp(ctk.CTk):
         # Показуємо що намагаємось підключитись
         self.status_indicator.set_connecting()
         self.connect_btn.configure(text="...", state="disabled")
-        self.update()
 
         host = self.host_entry.get().strip() or "127.0.0.1"
         try:
@@ -871,22 +1357,20 @@ class ModernDictionaryApp(ctk.CTk):
         except ValueError:
             port = 8080
 
-        self.network.host = host
-        self.network.port = port
+        self.network.set_host(host)
+        self.network.set_port(port)
 
-        # Запускаємо підключення в фоновому потоці
-        def connect_thread():
+        # Запускаємо підключення в мережевому циклі
+        async def connect_task():
             try:
-                connected = self.network.connect()
+                connected = await self.network.connect_async()
                 # Оновлюємо UI в головному потоці
                 self.after(0, lambda: self._on_auto_connect_result(connected, host, port))
             except Exception as e:
                 logger.error(f"[UI] Помилка автопідключення: {e}")
                 self.after(0, lambda: self._on_auto_connect_result(False, host, port))
-        
-        thread = threading.Thread(target=connect_thread, daemon=True)
-        thread.start()
-        self._network_threads.append(thread)
+
+        self._run_network(connect_task())
     
     def _on_auto_connect_result(self, connected: bool, host: str, port: int):
         """Обробка результату автопідключення (викликається в UI потоці)."""
@@ -1024,14 +1508,21 @@ class ModernDictionaryApp(ctk.CTk):
 
     def _start_drag(self, event):
         """Початок перетягування вікна."""
-        self._drag_data["x"] = event.x
-        self._drag_data["y"] = event.y
+        # Положення вікна запитуємо в Tk один раз тут, а не на кожен рух миші
+        self._drag_x = event.x_root - self.winfo_x()
+        self._drag_y = event.y_root - self.winfo_y()
 
     def _on_drag(self, event):
-        """Перетягування вікна."""
-        x = self.winfo_x() - self._drag_data["x"] + event.x
-        y = self.winfo_y() - self._drag_data["y"] + event.y
-        self.geometry(f"+{x}+{y}")
+        """Перетягування вікна (серія подій руху зливається в одну зміну geometry)."""
+        self._drag_geometry = f"+{event.x_root - self._drag_x}+{event.y_root - self._drag_y}"
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.after_idle(self._apply_drag_geometry)
+
+    def _apply_drag_geometry(self):
+        """Застосовує останню позицію вікна, накопичену під час перетягування."""
+        self._drag_pending = False
+        self.geometry(self._drag_geometry)
 
     def _minimize_window(self):
         """Згортання вікна."""
@@ -1063,13 +1554,13 @@ class ModernDictionaryApp(ctk.CTk):
                 except Exception as e:
                     logger.warning(f"[UI] Помилка закриття БД: {e}")
             
-            # Очікуємо завершення активних мережевих потоків (з таймаутом)
-            for thread in self._network_threads[:]:  # Копіюємо список
-                if thread.is_alive():
-                    thread.join(timeout=0.5)  # Максимум 0.5 секунди на потік
-                    if thread.is_alive():
-                        logger.warning(f"[UI] Мережевий потік не завершився вчасно")
+            # Зупиняємо мережевий цикл (потік-демон завершиться разом із ним)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            # Скасовуємо ще не розпочаті завдання пулу; вікно не чекає на зависле підключення
+            self._net_pool.shutdown(wait=False, cancel_futures=True)
             
+            # Дописуємо журнал, що ще чекає в черзі
+            self._flush_log_queue()
             logger.info("[UI] Застосунок закривається")
         except Exception as e:
             logger.error(f"[UI] Помилка при закритті: {e}")
@@ -1126,7 +1617,7 @@ class ModernDictionaryApp(ctk.CTk):
             # НЕ ставимо state="disabled" тут - зробимо це окремо
         )
         self.search_entry.pack(side="left", fill="x", expand=True, padx=(0, 15))
-        self.search_entry.bind('<Return>', lambda e: self._translate())
+        self.search_entry.bind('<Return>', self._translate)
 
         # Блокуємо ПІСЛЯ створення щоб placeholder працював коректно
         self.search_entry.configure(state="disabled")
@@ -1193,13 +1684,37 @@ class ModernDictionaryApp(ctk.CTk):
         self.host_entry.pack(side="right")
 
     def _show_start_screen(self):
-        """Показати стартовий екран з Word of the Day."""
-        # Очищаємо контент
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        """Показати стартовий екран з Word of the Day (екран будується один раз і кешується)."""
+        if self.results_container is not None:
+            self.results_container.pack_forget()
+        self._ensure_start_screen().pack(fill="both", expand=True)
+
+        # Підказка залежно від статусу підключення
+        if self.network.connected:
+            hint_text = "Введіть слово вище для перекладу"
+            hint_color = COLORS["text_secondary"]
+        else:
+            hint_text = "⚠️ Натисніть 'Connect' щоб підключитися до сервера"
+            hint_color = "#F59E0B"  # Warning yellow
+        self.start_hint_label.configure(text=hint_text, text_color=hint_color)
+
+        # Спробуємо завантажити слово дня
+        self.after(500, self._refresh_word_of_the_day)
+
+    def _ensure_start_screen(self):
+        """
+        Створює віджети стартового екрана при першому виклику.
+
+        Returns:
+            CTkFrame: Кешований фрейм стартового екрана.
+        """
+        if self._start_screen_frame is not None:
+            return self._start_screen_frame
+
+        self._start_screen_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
 
         # Центрований контейнер
-        center_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        center_frame = ctk.CTkFrame(self._start_screen_frame, fg_color="transparent")
         center_frame.place(relx=0.5, rely=0.4, anchor="center")
 
         # Привітання
@@ -1210,20 +1725,14 @@ class ModernDictionaryApp(ctk.CTk):
             text_color=COLORS["text_primary"]
         ).pack(pady=(80, 10))
 
-        # Підказка залежно від статусу підключення
-        if self.network.connected:
-            hint_text = "Введіть слово вище для перекладу"
-            hint_color = COLORS["text_secondary"]
-        else:
-            hint_text = "⚠️ Натисніть 'Connect' щоб підключитися до сервера"
-            hint_color = "#F59E0B"  # Warning yellow
-
-        ctk.CTkLabel(
+        # Підказка (текст залежить від статусу підключення, оновлюється в _show_start_screen)
+        self.start_hint_label = ctk.CTkLabel(
             center_frame,
-            text=hint_text,
+            text="",
             font=("Segoe UI", 14),
-            text_color=hint_color
-        ).pack(pady=(0, 40))
+            text_color=COLORS["text_secondary"]
+        )
+        self.start_hint_label.pack(pady=(0, 40))
 
         # === WORD OF THE DAY CARD ===
         wotd_card = ctk.CTkFrame(
@@ -1272,7 +1781,7 @@ class ModernDictionaryApp(ctk.CTk):
             hover_color=COLORS["border"],
             text_color=COLORS["text_secondary"],
             corner_radius=6,
-            command=self._refresh_word_of_the_day
+            command=lambda: self._refresh_word_of_the_day(force=True)
         ).pack(side="right")
 
         # Word
@@ -1301,8 +1810,7 @@ class ModernDictionaryApp(ctk.CTk):
             border_width=0
         )
         self.wotd_definition_textbox.pack(padx=20, pady=20, fill="both", expand=True)
-        self.wotd_definition_textbox.insert("1.0", "Привіт! Вітаємо вас у E-Dictionary Pro!'")
-        self.wotd_definition_textbox.configure(state="disabled")
+        _set_textbox_text(self.wotd_definition_textbox, "Привіт! Вітаємо вас у E-Dictionary Pro!'")
 
         # Hint
         ctk.CTkLabel(
@@ -1312,18 +1820,27 @@ class ModernDictionaryApp(ctk.CTk):
             text_color=COLORS["text_muted"]
         ).pack(pady=(30, 0))
 
-        # Спробуємо завантажити слово дня
-        self.after(500, self._refresh_word_of_the_day)
+        return self._start_screen_frame
 
     def _show_results_screen(self):
-        """Показати екран результатів (SCROLLABLE FIX)."""
-        # Очищаємо контент
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        """Показати екран результатів (SCROLLABLE FIX); попередні картки прибираються."""
+        if self._start_screen_frame is not None:
+            self._start_screen_frame.pack_forget()
+        self._ensure_results_screen().pack(fill="both", expand=True, padx=20, pady=10)
+        self._clear_results()
+
+    def _ensure_results_screen(self):
+        """
+        Створює віджети екрана результатів при першому виклику.
+
+        Returns:
+            CTkFrame: Кешований контейнер екрана результатів.
+        """
+        if self.results_container is not None:
+            return self.results_container
 
         # Results Container
         self.results_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        self.results_container.pack(fill="both", expand=True, padx=20, pady=10)
 
         # Results Header
         results_header = ctk.CTkFrame(self.results_container, fg_color="transparent")
@@ -1360,6 +1877,7 @@ class ModernDictionaryApp(ctk.CTk):
         )
         self.results_frame.pack(fill="both", expand=True, pady=(10, 0))
 
+        return self.results_container
 
     def save_new_word(self, word: str, definition: str, window, error_label=None):
         """
@@ -1382,45 +1900,82 @@ class ModernDictionaryApp(ctk.CTk):
         
         # Send ADD_WORD command via network
         if self.network.connected:
-            response = self.network.send_command(f"ADD_WORD|{word}|{definition}")
-            
-            if response and response.startswith("Success"):
-                # Show success message
-                messagebox.showinfo("Success", f"Word '{word}' has been successfully added to the dictionary!")
-                # Close window and show success log
-                window.destroy()
-                self._add_to_log_panel(f"✅ Saved: {word}")
-                logger.info(f"Додано слово: '{word}'")
-                # Immediately display the added word with the same renderer as searched words
-                # First show results screen, then display translation
-                self._show_results_screen()
-                # Format: "word|definition" for _display_translation
-                self._display_translation(word, f"{word}|{definition}")
-            elif response and response.startswith("Error"):
-                # Handle error response - show red error label and keep popup open
-                error_message = "This word already exists!"
-                if error_label:
-                    error_label.configure(text=error_message)
-                else:
-                    # Fallback to messagebox if error_label not provided
-                    messagebox.showerror("Error", error_message)
-                logger.warning(f"Спроба додати існуюче слово: '{word}'")
-            else:
-                # Other errors - show messagebox
-                messagebox.showerror("Error", f"Failed to add word: {response or 'Unknown error'}")
+            # Запит іде в мережевому циклі, щоб вікно не завмирало до відповіді сервера
+            async def save_task():
+                try:
+                    # Готова команда ADD з байтових префіксів; '|' у визначенні екранується клієнтом
+                    response = await self.network.add_word_async(word, definition)
+                except Exception as e:
+                    logger.error(f"[UI] Помилка збереження слова: {e}")
+                    response = None
+                self.after(0, lambda: self._on_save_word_result(word, definition, window, error_label, response))
+
+            self._run_network(save_task())
         else:
             # If offline, show warning
             messagebox.showwarning("Offline", 
                 "Cannot save word: not connected to server.\n\n"
                 "Please connect first.")
+
+    def _on_save_word_result(self, word: str, definition: str, window, error_label, response: str | None):
+        """Обробка відповіді на ADD_WORD (викликається в UI потоці)."""
+        # Статус - перше поле відповіді ("Success|..." / "Error|...")
+        status = response.partition('|')[0] if response else ""
+        if status == "Success":
+            # Show success message
+            messagebox.showinfo("Success", f"Word '{word}' has been successfully added to the dictionary!")
+            # Hide window (it is reused on the next open) and show success log
+            self._hide_popup(window)
+            self._add_to_log_panel(f"✅ Saved: {word}")
+            logger.info(f"Додано слово: '{word}'")
+            # Immediately display the added word with the same renderer as searched words
+            # First show results screen, then display translation
+            self._show_results_screen()
+            # Format: "word|definition" for _display_translation
+            self._display_translation(word, f"{word}|{definition}")
+        elif status == "Error":
+            # Handle error response - show red error label and keep popup open
+            error_message = "This word already exists!"
+            if error_label and error_label.winfo_exists():
+                error_label.configure(text=error_message)
+            else:
+                # Fallback to messagebox if error_label not provided
+                messagebox.showerror("Error", error_message)
+            logger.warning(f"Спроба додати існуюче слово: '{word}'")
+        else:
+            # Other errors - show messagebox
+            messagebox.showerror("Error", f"Failed to add word: {response or 'Unknown error'}")
     
     def _show_add_word_dialog(self):
         """
         Показати професійний popup діалог для додавання нового слова.
 
         Відкриває CTkToplevel вікно з полями для введення слова
-        та його перекладу. Виглядає як нативний діалог.
+        та його перекладу. Виглядає як нативний діалог. Вікно будується
+        один раз і далі лише ховається/показується з очищеними полями.
         """
+        popup = self._add_word_popup
+        if popup is None or not popup.winfo_exists():
+            self._build_add_word_popup()
+            return
+
+        self._add_word_entry.delete(0, "end")
+        self._add_word_definition.delete("1.0", "end")
+        self._add_word_error.configure(text="")
+        popup.deiconify()
+        popup.grab_set()
+        self._add_word_entry.focus()
+
+    def _hide_popup(self, popup):
+        """Сховати кешований popup (withdraw замість destroy для повторного показу)."""
+        try:
+            popup.grab_release()
+            popup.withdraw()
+        except Exception:
+            pass
+
+    def _build_add_word_popup(self):
+        """Побудувати popup додавання слова та зберегти його віджети для повторного показу."""
         # Створюємо popup вікно
         popup = ctk.CTkToplevel(self)
         popup.title("Add to Dictionary")
@@ -1542,28 +2097,12 @@ class ModernDictionaryApp(ctk.CTk):
         chips_inner.pack(fill="x")
 
         # Tag buttons (chips) - all 7 tags
-        tag_buttons = [
-            ("[NOUN]", "[NOUN] "),
-            ("[VERB]", "[VERB] "),
-            ("[ADJ]", "[ADJ] "),
-            ("[ADV]", "[ADV] "),
-            ("[PHRASE]", "[PHRASE] "),
-            ("[IT]", "[IT] "),
-            ("[SCI]", "[SCI] ")
-        ]
-
-        for tag_label, tag_text in tag_buttons:
+        for tag_label, tag_text in self.TAG_BUTTONS:
             chip_btn = ctk.CTkButton(
                 chips_inner,
                 text=tag_label,
-                width=60,
-                height=26,
-                font=("Segoe UI", 10),
-                fg_color="#87CEEB",  # Light blue (Sky Blue)
-                hover_color="#6BB6FF",  # Slightly darker on hover
-                text_color="#FFFFFF",
-                corner_radius=12,
-                command=lambda t=tag_text: insert_tag(t)
+                command=lambda t=tag_text: insert_tag(t),
+                **self._CHIP_KW
             )
             chip_btn.pack(side="left", padx=(0, 5))
 
@@ -1572,8 +2111,17 @@ class ModernDictionaryApp(ctk.CTk):
         btn_frame.pack(fill="x", pady=(10, 0))  # Додано явний padding
 
         def cancel():
-            """Закрити popup."""
-            popup.destroy()
+            """Сховати popup."""
+            self._hide_popup(popup)
+
+        def save(event=None):
+            """Зберегти слово з полів popup (кнопка Save та Ctrl+Enter)."""
+            self.save_new_word(
+                word_entry.get().strip(),
+                definition_textbox.get("1.0", "end-1c").strip(),
+                popup,
+                error_label
+            )
 
         # Кнопка Cancel (Grey) - явно упакована
         cancel_btn = ctk.CTkButton(
@@ -1605,33 +2153,51 @@ class ModernDictionaryApp(ctk.CTk):
             hover_color="#218838",
             text_color="#FFFFFF",
             corner_radius=8,
-            command=lambda: self.save_new_word(
-                word_entry.get().strip(),
-                definition_textbox.get("1.0", "end-1c").strip(),
-                popup,
-                error_label
-            )
+            command=save
         )
         save_btn.pack(side="right", padx=(10, 0))  # Додано явний padding для видимості
 
         # Bind Enter для збереження (Ctrl+Enter for textbox)
-        definition_textbox.bind('<Control-Return>',
-            lambda e: self.save_new_word(
-                word_entry.get().strip(),
-                definition_textbox.get("1.0", "end-1c").strip(),
-                popup,
-                error_label
-            )
-        )
+        definition_textbox.bind('<Control-Return>', save)
         word_entry.bind('<Return>',
             lambda e: definition_textbox.focus()
         )
 
+        # Закриття хрестиком лише ховає вікно
+        popup.protocol("WM_DELETE_WINDOW", cancel)
+
+        self._add_word_popup = popup
+        self._add_word_entry = word_entry
+        self._add_word_definition = definition_textbox
+        self._add_word_error = error_label
+
         # Фокус на перше поле
         word_entry.focus()
 
     def _show_history_favorites_popup(self):
-        """Показати професійний popup з історією та улюбленими словами (CTkTabview)."""
+        """
+        Показати професійний popup з історією та улюбленими словами (CTkTabview).
+
+        Вікно будується один раз; повторне відкриття лише показує його
+        й оновлює обидва списки.
+        """
+        popup = self._saved_popup
+        if popup is None or not popup.winfo_exists():
+            self._build_history_favorites_popup()
+        else:
+            self._saved_tabview.set("History")
+            popup.deiconify()
+            popup.lift()
+            popup.grab_set()
+
+        # Load and display History
+        self._load_history_tab(self._history_list)
+
+        # Load and display Favorites
+        self._load_favorites_tab(self._favorites_list)
+
+    def _build_history_favorites_popup(self):
+        """Побудувати popup Saved & History та зберегти його віджети для повторного показу."""
         popup = ctk.CTkToplevel(self)
         popup.title("Saved & History")
         popup.geometry("500x600")
@@ -1662,7 +2228,7 @@ class ModernDictionaryApp(ctk.CTk):
             text_color=COLORS["text_secondary"],
             hover_color=COLORS["border"],
             corner_radius=6,
-            command=popup.destroy
+            command=lambda: self._hide_popup(popup)
         ).pack(side="right", padx=20, pady=15)
 
         # Tabview with History and Favorites tabs
@@ -1687,24 +2253,12 @@ class ModernDictionaryApp(ctk.CTk):
             text_color=COLORS["text_secondary"],
             hover_color=COLORS["border"],
             corner_radius=6,
-            command=lambda: self._clear_history_and_refresh(history_scroll_frame, popup)
+            command=lambda: self._clear_history_and_refresh(history_list)
         ).pack(side="right")
 
-        # Scrollable frame for history
-        history_scroll_frame = ctk.CTkScrollableFrame(history_tab, fg_color="transparent")
-        history_scroll_frame.pack(fill="both", expand=True, padx=12, pady=(0, 12))
-
-        # Tab 2: Favorites
-        favorites_tab = tabview.add("Favorites")
-        favorites_tab.configure(fg_color=COLORS["bg_main"])
-
-        # Scrollable frame for favorites
-        favorites_scroll_frame = ctk.CTkScrollableFrame(favorites_tab, fg_color="transparent")
-        favorites_scroll_frame.pack(fill="both", expand=True, padx=12, pady=12)
-
         # Function to handle word click (closes popup, sets search, triggers translation)
         def search_word(word):
-            popup.destroy()
+            self._hide_popup(popup)
             self.search_entry.delete(0, 'end')
             self.search_entry.insert(0, word)
             # Trigger translation if connected
@@ -1713,157 +2267,95 @@ class ModernDictionaryApp(ctk.CTk):
             else:
                 messagebox.showwarning("No Connection", "Please connect to the server first!")
 
-        # Load and display History
-        self._load_history_tab(history_scroll_frame, search_word, popup)
+        # Virtualized list for history
+        history_list = VirtualWordList(
+            history_tab,
+            icon="🕒",
+            empty_text="No recent searches",
+            on_select=search_word,
+            on_delete=lambda w: self._delete_history_word(w, history_list)
+        )
+        history_list.pack(fill="both", expand=True, padx=12, pady=(0, 12))
 
-        # Load and display Favorites
-        self._load_favorites_tab(favorites_scroll_frame, search_word, popup)
-
-    def _load_history_tab(self, frame, search_callback, popup):
-        """Завантажити та відобразити історію в frame з кнопками видалення."""
-        # Clear existing widgets
-        for widget in frame.winfo_children():
-            widget.destroy()
-
-        # Отримуємо історію з бази даних
-        history_words = self.db.get_history_words(limit=50)
-
-        if not history_words:
-            ctk.CTkLabel(
-                frame,
-                text="No recent searches",
-                font=("Segoe UI", 13),
-                text_color=COLORS["text_muted"]
-            ).pack(pady=50)
-        else:
-            for word in history_words:
-                # Item frame with word button and delete button
-                item_frame = ctk.CTkFrame(frame, fg_color="transparent")
-                item_frame.pack(fill="x", pady=3)
-
-                # Word button (clickable)
-                word_btn = ctk.CTkButton(
-                    item_frame,
-                    text=f"🕒 {word}",
-                    font=("Segoe UI", 13),
-                    fg_color="transparent",
-                    text_color=COLORS["text_primary"],
-                    hover_color=COLORS["border"],
-                    anchor="w",
-                    height=38,
-                    corner_radius=8,
-                    command=lambda w=word: search_callback(w)
-                )
-                word_btn.pack(side="left", fill="x", expand=True, padx=(0, 5))
-
-                # Delete button (X icon)
-                delete_btn = ctk.CTkButton(
-                    item_frame,
-                    text="✕",
-                    width=36,
-                    height=38,
-                    font=("Segoe UI", 12),
-                    fg_color="transparent",
-                    text_color=COLORS["text_muted"],
-                    hover_color=COLORS["danger"],
-                    corner_radius=8,
-                    command=lambda w=word: self._delete_history_word(w, frame, search_callback, popup)
-                )
-                delete_btn.pack(side="right")
-
-    def _load_favorites_tab(self, frame, search_callback, popup):
-        """Завантажити та відобразити улюблені слова в frame з кнопками видалення."""
-        # Clear existing widgets
-        for widget in frame.winfo_children():
-            widget.destroy()
-
-        # Отримуємо улюблені з бази даних
-        favorites = self.db.get_favorites()
-
-        if not favorites:
-            ctk.CTkLabel(
-                frame,
-                text="No favorite words",
-                font=("Segoe UI", 13),
-                text_color=COLORS["text_muted"]
-            ).pack(pady=50)
-        else:
-            for word, translation in favorites:
-                # Item frame with word button and delete button
-                item_frame = ctk.CTkFrame(frame, fg_color="transparent")
-                item_frame.pack(fill="x", pady=3)
-
-                # Word button (clickable)
-                word_btn = ctk.CTkButton(
-                    item_frame,
-                    text=f"⭐ {word}",
-                    font=("Segoe UI", 13),
-                    fg_color="transparent",
-                    text_color=COLORS["text_primary"],
-                    hover_color=COLORS["border"],
-                    anchor="w",
-                    height=38,
-                    corner_radius=8,
-                    command=lambda w=word: search_callback(w)
-                )
-                word_btn.pack(side="left", fill="x", expand=True, padx=(0, 5))
-
-                # Delete button (X icon)
-                delete_btn = ctk.CTkButton(
-                    item_frame,
-                    text="✕",
-                    width=36,
-                    height=38,
-                    font=("Segoe UI", 12),
-                    fg_color="transparent",
-                    text_color=COLORS["text_muted"],
-                    hover_color=COLORS["danger"],
-                    corner_radius=8,
-                    command=lambda w=word: self._delete_favorite_word(w, frame, search_callback, popup)
-                )
-                delete_btn.pack(side="right")
+        # Tab 2: Favorites
+        favorites_tab = tabview.add("Favorites")
+        favorites_tab.configure(fg_color=COLORS["bg_main"])
+
+        # Virtualized list for favorites
+        favorites_list = VirtualWordList(
+            favorites_tab,
+            icon="⭐",
+            empty_text="No favorite words",
+            on_select=search_word,
+            on_delete=lambda w: self._delete_favorite_word(w, favorites_list)
+        )
+        favorites_list.pack(fill="both", expand=True, padx=12, pady=12)
+
+        # Закриття хрестиком вікна лише ховає його
+        popup.protocol("WM_DELETE_WINDOW", lambda: self._hide_popup(popup))
+
+        self._saved_popup = popup
+        self._saved_tabview = tabview
+        self._history_list = history_list
+        self._favorites_list = favorites_list
+
+    def _load_history_tab(self, word_list):
+        """Завантажити історію з бази даних у віртуалізований список."""
+        word_list.set_items(self._cached_history())
+
+    def _load_favorites_tab(self, word_list):
+        """Завантажити улюблені слова з бази даних у віртуалізований список."""
+        word_list.set_items(word for word, _ in self._cached_favorites())
 
-    def _delete_history_word(self, word: str, frame, search_callback, popup):
+    def _cached_history(self):
+        """Останні слова історії (з бази лише після зміни історії)."""
+        if self._history_cache is None:
+            self._history_cache = self.db.get_history_words(limit=50)
+        return self._history_cache
+
+    def _cached_favorites(self):
+        """Улюблені слова (з бази лише після зміни улюблених)."""
+        if self._favorites_cache is None:
+            self._favorites_cache = self.db.get_favorites()
+        return self._favorites_cache
+
+    def _delete_history_word(self, word: str, word_list):
         """Видалити конкретне слово з історії."""
         success = self.db.remove_from_history(word)
         if success:
-            # Reload the tab
-            self._load_history_tab(frame, search_callback, popup)
+            # Наступне відкриття перечитає історію (з бази може підтягнутися 51-ше слово)
+            self._history_cache = None
+            word_list.remove_item(word)
             self._add_to_log_panel(f"🗑️ Removed '{word}' from history")
             logger.info(f"Видалено з історії: '{word}'")
         else:
             logger.warning(f"Не вдалося видалити з історії: '{word}'")
 
-    def _delete_favorite_word(self, word: str, frame, search_callback, popup):
+    def _delete_favorite_word(self, word: str, word_list):
         """Видалити слово з улюблених."""
         success = self.db.remove_favorite(word)
         if success:
-            # Reload the tab
-            self._load_favorites_tab(frame, search_callback, popup)
+            if self._favorites_cache is not None:
+                self._favorites_cache = [item for item in self._favorites_cache if item[0] != word]
+            word_list.remove_item(word)
             self._add_to_log_panel(f"🗑️ Removed '{word}' from favorites")
             logger.info(f"Видалено з улюблених: '{word}'")
         else:
             logger.warning(f"Не вдалося видалити з улюблених: '{word}'")
 
-    def _clear_history_and_refresh(self, frame, popup):
+    def _clear_history_and_refresh(self, word_list):
         """Очистити історію та оновити відображення."""
         self._clear_history()
         # Reload history tab
-        def search_callback(word):
-            popup.destroy()
-            self.search_entry.delete(0, 'end')
-            self.search_entry.insert(0, word)
-            if self.network.connected:
-                self._translate()
-        self._load_history_tab(frame, search_callback, popup)
+        self._load_history_tab(word_list)
 
     def _bind_shortcuts(self):
         """Прив'язка клавіатурних скорочень."""
-        self.bind('<Control-h>', lambda e: self._show_about())
-        self.bind('<Control-H>', lambda e: self._show_about())
-        self.bind('<Escape>', lambda e: self._focus_search())
+        self.bind('<Control-h>', self._show_about)
+        self.bind('<Control-H>', self._show_about)
+        self.bind('<Escape>', self._focus_search)
 
-    def _focus_search(self):
+    def _focus_search(self, event=None):
         """Встановлення фокусу на поле пошуку."""
         try:
             if hasattr(self, 'search_entry') and self.search_entry.winfo_exists():
@@ -1979,7 +2471,6 @@ class ModernDictionaryApp(ctk.CTk):
         else:
             self.status_indicator.set_connecting()
             self.connect_btn.configure(text="...", state="disabled")
-            self.update()
 
             host = self.host_entry.get().strip() or "127.0.0.1"
             try:
@@ -1987,22 +2478,20 @@ class ModernDictionaryApp(ctk.CTk):
             except ValueError:
                 port = 8080
 
-            self.network.host = host
-            self.network.port = port
+            self.network.set_host(host)
+            self.network.set_port(port)
 
-            # Запускаємо підключення в фоновому потоці
-            def connect_thread():
+            # Запускаємо підключення в мережевому циклі
+            async def connect_task():
                 try:
-                    connected = self.network.connect()
+                    connected = await self.network.connect_async()
                     # Оновлюємо UI в головному потоці
                     self.after(0, lambda: self._on_connect_result(connected, host, port))
                 except Exception as e:
                     logger.error(f"[UI] Помилка підключення: {e}")
                     self.after(0, lambda: self._on_connect_result(False, host, port))
-            
-            thread = threading.Thread(target=connect_thread, daemon=True)
-            thread.start()
-            self._network_threads.append(thread)
+
+            self._run_network(connect_task())
     
     def _on_connect_result(self, connected: bool, host: str, port: int):
         """Обробка результату підключення (викликається в UI потоці)."""
@@ -2024,8 +2513,8 @@ class ModernDictionaryApp(ctk.CTk):
                 f"Переконайтесь, що сервер запущено."
             )
 
-    def _translate(self):
-        """Виконання перекладу слова (в фоновому потоці)."""
+    def _translate(self, event=None):
+        """Виконання перекладу слова (в фоновому потоці); event - від прив'язки <Return>."""
         # Empty input protection - do nothing if input is empty
         search_term = self.search_entry.get().strip()
         if not search_term:
@@ -2037,28 +2526,36 @@ class ModernDictionaryApp(ctk.CTk):
             messagebox.showwarning("Немає з'єднання", "Спочатку підключіться до сервера!")
             return
 
+        # Той самий запит уже в дорозі - результат покаже перший виклик
+        if word in self._inflight_translations:
+            return
+        self._inflight_translations.add(word)
+
         self.search_btn.configure(text="🔍 Думаю...", state="disabled")
-        self.update()
 
         # Показуємо results screen одразу
         self._show_results_screen()
 
-        # Запускаємо переклад в фоновому потоці
-        def translate_thread():
+        # Запускаємо переклад в мережевому циклі
+        async def translate_task():
             try:
-                response = self.network.translate(word)
+                response = await self.network.translate_async(word)
+                # Форматування (чисті регулярні вирази) теж робимо тут, а не в UI потоці
+                formatted = None
+                if response and "|" in response:
+                    headword, definition_body = response.split("|", 1)
+                    formatted = format_and_display(definition_body.strip(), headword=headword.strip())
                 # Оновлюємо UI в головному потоці
-                self.after(0, lambda: self._on_translate_result(word, response))
+                self.after(0, lambda: self._on_translate_result(word, response, formatted))
             except Exception as e:
                 logger.error(f"[UI] Помилка перекладу: {e}")
                 self.after(0, lambda: self._on_translate_result(word, None))
-        
-        thread = threading.Thread(target=translate_thread, daemon=True)
-        thread.start()
-        self._network_threads.append(thread)
+
+        self._run_network(translate_task())
     
-    def _on_translate_result(self, word: str, response: str | None):
+    def _on_translate_result(self, word: str, response: str | None, formatted: str | None = None):
         """Обробка результату перекладу (викликається в UI потоці)."""
+        self._inflight_translations.discard(word)
         self.search_btn.configure(text="🔍 Translate", state="normal")
 
         if response is None or response == "":
@@ -2066,12 +2563,12 @@ class ModernDictionaryApp(ctk.CTk):
             self.connect_btn.configure(text="Connect")
             self._add_to_log_panel(f"Втрачено з'єднання: '{word}'")
             messagebox.showerror("Помилка", "З'єднання з сервером втрачено!")
-        elif response == "NOT_FOUND" or (isinstance(response, str) and response.strip().lower() in ["not found", "error", "notfound"]):
+        elif response == "NOT_FOUND" or (isinstance(response, str) and response.strip().lower() in _ERROR_RESPONSES):
             self._show_not_found(word)
             self._add_to_log_panel(f"Не знайдено: '{word}'")
             # DO NOT save "Not found" to History!
         else:
-            self._display_translation(word, response)
+            self._display_translation(word, response, formatted)
             self._add_to_log_panel(f"{word} → ...")
             # Note: History is now saved in _display_translation() immediately after parsing
 
@@ -2090,19 +2587,17 @@ class ModernDictionaryApp(ctk.CTk):
             messagebox.showwarning("Немає з'єднання", "Спочатку підключіться!")
             return False
 
-        # Запускаємо додавання в фоновому потоці
-        def add_word_thread():
+        # Запускаємо додавання в мережевому циклі
+        async def add_word_task():
             try:
-                response = self.network.add_word(ukr, eng)
+                response = await self.network.add_word_async(ukr, eng)
                 # Оновлюємо UI в головному потоці
                 self.after(0, lambda: self._on_add_word_result(ukr, eng, response))
             except Exception as e:
                 logger.error(f"[UI] Помилка додавання слова: {e}")
                 self.after(0, lambda: self._on_add_word_result(ukr, eng, None))
-        
-        thread = threading.Thread(target=add_word_thread, daemon=True)
-        thread.start()
-        self._network_threads.append(thread)
+
+        self._run_network(add_word_task())
         return False  # Результат буде показано через callback
     
     def _on_add_word_result(self, ukr: str, eng: str, response: str | None):
@@ -2117,7 +2612,7 @@ class ModernDictionaryApp(ctk.CTk):
             self._add_to_log_panel(f"Помилка: '{ukr}'")
             messagebox.showerror("Помилка", "Не вдалося додати слово.")
 
-    def _display_translation(self, search_query, raw_response):
+    def _display_translation(self, search_query, raw_response, formatted_definition=None):
         """
         Відображення результатів перекладу (English → Ukrainian).
 
@@ -2126,6 +2621,7 @@ class ModernDictionaryApp(ctk.CTk):
         Args:
             search_query: Запит користувача (англійське слово)
             raw_response: Відповідь сервера
+            formatted_definition: Визначення, вже відформатоване у фоновому потоці (необов'язково)
         """
         logger.info(f"Переклад: '{search_query}'")
 
@@ -2140,6 +2636,7 @@ class ModernDictionaryApp(ctk.CTk):
             clean_headword = headword.strip()
             if clean_headword and definition_body:
                 self.db.add_to_history(clean_headword, definition_body)
+                self._history_cache = None
             
             # Store current word for favorites toggle
             self.current_headword = clean_headword
@@ -2162,26 +2659,34 @@ class ModernDictionaryApp(ctk.CTk):
             
             # Check if it's an error/not found message
             response_lower = raw_response.strip().lower()
-            if response_lower in ["not found", "error", "notfound"]:
+            if response_lower in _ERROR_RESPONSES:
                 # Don't save error messages to history
                 logger.warning(f"Server returned error message: '{raw_response}'")
             else:
                 # If it's some other plain text (unexpected), save to history if valid
                 if clean_headword and definition_body:
                     self.db.add_to_history(clean_headword, definition_body)
+                    self._history_cache = None
                 logger.warning(f"Unexpected response format: '{raw_response}'")
 
-        # === Форматуємо визначення ===
-        formatted_definition = format_and_display(definition_body, headword=headword)
+        # === Форматуємо визначення (якщо це не зробив фоновий потік) ===
+        if formatted_definition is None:
+            formatted_definition = format_and_display(definition_body, headword=headword)
 
-        # === Створюємо картку результату ===
-        result_card = ResultCard(
-            self.results_frame,
-            headword=headword,
-            definition=formatted_definition,
-            favorite_callback=self._handle_favorite_toggle,
-            is_favorite=is_favorite
-        )
+        # === Картка результату: з пулу, якщо є, інакше нова ===
+        # Пул - стек, тож повторний пошук того ж слова отримує ту саму картку
+        # і reconfigure лише оновлює зірку
+        if self._result_card_pool:
+            result_card = self._result_card_pool.pop()
+            result_card.reconfigure(headword, formatted_definition, is_favorite=is_favorite)
+        else:
+            result_card = ResultCard(
+                self.results_frame,
+                headword=headword,
+                definition=formatted_definition,
+                favorite_callback=self._handle_favorite_toggle,
+                is_favorite=is_favorite
+            )
         result_card.pack(fill="x", pady=10)
 
     def _show_not_found(self, word):
@@ -2220,20 +2725,38 @@ class ModernDictionaryApp(ctk.CTk):
         ).pack()
 
     def _clear_results(self):
-        """Очищення області результатів."""
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
+        """Очищення області результатів; картки ховаються в пул замість знищення."""
+        # pack_slaves - лише показані віджети; картки з пулу вже приховані
+        for widget in self.results_frame.pack_slaves():
+            if isinstance(widget, ResultCard) and len(self._result_card_pool) < RESULT_CARD_POOL_SIZE:
+                widget.pack_forget()
+                self._result_card_pool.append(widget)
+            else:
+                widget.destroy()
 
     def _clear_history(self):
         """Очищення історії пошуку."""
         self.db.clear_history()
+        self._history_cache = None
         self._add_to_log_panel("Історію очищено")
 
     def _add_to_log_panel(self, message):
-        """Виводить повідомлення в консоль та логер."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] {message}")
+        """Пише повідомлення в логер; вивід у консоль накопичується й друкується раз на 50 мс."""
         logger.info(message)
+        self._log_queue.append((time.time(), message))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.after(50, self._flush_log_queue)
+
+    def _flush_log_queue(self):
+        """Друкує накопичені повідомлення журналу одним print."""
+        self._log_flush_pending = False
+        lines = []
+        while self._log_queue:
+            stamp, message = self._log_queue.popleft()
+            lines.append(f"[{datetime.fromtimestamp(stamp).strftime('%H:%M:%S')}] {message}")
+        if lines:
+            print("\n".join(lines))
 
     def _copy_wotd(self):
         """Копіювання Word of the Day в буфер обміну (тільки переклад)."""
@@ -2268,51 +2791,77 @@ class ModernDictionaryApp(ctk.CTk):
         Returns:
             Чистий текст перекладу
         """
-        # Видаляємо заголовки частин мови типу [ NOUN ], [ VERB ] тощо
-        text = re.sub(r'\[\s*(NOUN|VERB|ADJECTIVE|ADVERB|PREPOSITION|CONJUNCTION|PRONOUN|INTERJECTION|NUMERAL|PHRASAL VERB)\s*\]', '', text)
+        return _clean_text_for_copy(text, headword)
 
-        # Видаляємо headword якщо він на початку
-        if headword:
-            pattern = rf'^\s*{re.escape(headword)}\s*\n?'
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    def _refresh_word_of_the_day(self, force: bool = False):
+        """
+        Оновити слово дня (запит і форматування - у мережевому циклі).
 
-        # Очищаємо зайві переноси рядків та пробіли
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'^\s+', '', text, flags=re.MULTILINE)
-        text = text.strip()
+        Слово на сьогодні береться з кешу бази без звернення до сервера;
+        новий запит GET_RANDOM робиться лише за кнопкою оновлення.
 
-        return text
+        Args:
+            force: Ігнорувати кеш і запросити нове слово з сервера.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        if not force:
+            cached = self.db.get_wotd(today)
+            if cached:
+                word, _, definition = cached.partition('|')
+                word = word.strip()
+                self._on_word_of_the_day_result(
+                    word.title(), format_and_display(definition.strip(), headword=word)
+                )
+                return
 
-    def _refresh_word_of_the_day(self):
-        """Оновити слово дня з сервера."""
         if not self.network.connected:
             self.wotd_word_label.configure(text="Offline")
             self._update_wotd_textbox("Підключіться для слова дня")
             return
 
-        try:
-            # Запитуємо випадкове слово через network
-            response = self.network.send_command("GET_RANDOM|")
+        async def wotd_task():
+            try:
+                # Запитуємо випадкове слово через network
+                response = await self.network.send_command_async("GET_RANDOM|")
+
+                if response and response != "NOT_FOUND" and '|' in response:
+                    parts = response.split('|', 1)
+                    word = parts[0].strip()
+                    definition = parts[1].strip() if len(parts) > 1 else ""
+
+                    # Форматуємо визначення через наш Human-Readable Formatter
+                    formatted_definition = format_and_display(definition, headword=word)
+                    logger.info(f"Слово дня: {word}")
+                    self.db.set_wotd(today, response)
+                    self.after(0, lambda: self._on_word_of_the_day_result(word.title(), formatted_definition))
+                else:
+                    # Якщо сервер не підтримує GET_RANDOM - показуємо заглушку
+                    self.after(0, lambda: self._on_word_of_the_day_result(
+                        "Hello", "Привіт! Вітання, формальне або неформальне."
+                    ))
+            except Exception as e:
+                logger.error(f"Помилка отримання слова дня: {e}")
+                self.after(0, lambda: self._on_word_of_the_day_result("—", "Недоступно"))
 
-            if response and response != "NOT_FOUND" and '|' in response:
-                parts = response.split('|', 1)
-                word = parts[0].strip()
-                definition = parts[1].strip() if len(parts) > 1 else ""
+        self._run_network(wotd_task())
 
-                # Форматуємо визначення через наш Human-Readable Formatter
-                formatted_definition = format_and_display(definition, headword=word)
+    def _on_word_of_the_day_result(self, title: str, text: str):
+        """
+        Показати слово дня (викликається в UI потоці).
 
-                self.wotd_word_label.configure(text=word.title())
-                self._update_wotd_textbox(formatted_definition)
-                logger.info(f"Слово дня: {word}")
-            else:
-                # Якщо сервер не підтримує GET_RANDOM - показуємо заглушку
-                self.wotd_word_label.configure(text="Hello")
-                self._update_wotd_textbox("Привіт! Вітання, формальне або неформальне.")
+        Args:
+            title: Текст заголовка (слово або заглушка).
+            text: Відформатоване визначення або повідомлення.
+        """
+        try:
+            # Поки потік працював, стартовий екран могли вже замінити результатами
+            if not self.wotd_word_label.winfo_exists():
+                return
+            self.wotd_word_label.configure(text=title)
         except Exception as e:
-            logger.error(f"Помилка отримання слова дня: {e}")
-            self.wotd_word_label.configure(text="—")
-            self._update_wotd_textbox("Недоступно")
+            logger.error(f"Помилка оновлення слова дня: {e}")
+            return
+        self._update_wotd_textbox(text)
 
     def _update_wotd_textbox(self, text: str):
         """Оновити текстове поле слова дня з форматуванням та кольоровими тегами."""
@@ -2343,6 +2892,7 @@ class ModernDictionaryApp(ctk.CTk):
         # Use stored current values if available, otherwise use passed parameters
         clean_word = (self.current_headword or word).strip()
         clean_definition = (self.current_definition or definition).strip()
+        self._favorites_cache = None
         
         if is_favorite:
             # Додаємо до улюблених
@@ -2369,7 +2919,7 @@ class ModernDictionaryApp(ctk.CTk):
                 else:
                     logger.warning(f"Не вдалося видалити з улюблених: '{clean_word}'")
 
-    def _show_about(self):
+    def _show_about(self, event=None):
         """Показати діалог 'Про програму'."""
         messagebox.showinfo(
             "Про E-Dictionary Pro",